@@ -34,6 +34,10 @@ setup(
         "python-socketio[client]>=5.0.0",
         "packaging"
     ],
+    extras_require={
+        "asyncio": ["python-socketio[asyncio_client]>=5.0.0"],
+        "numpy": ["numpy"]
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Web Environment",
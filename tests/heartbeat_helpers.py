@@ -0,0 +1,25 @@
+from uptime_kuma_api import MonitorStatus
+from uptime_kuma_api.heartbeat_columns import format_heartbeat_time
+
+start = 1672531200  # 2023-01-01 00:00:00 (Sunday)
+
+
+def heartbeats(statuses, monitor_id=1, interval=60, offset=0, pings=None):
+    # one heartbeat for each status, every interval seconds from start + offset
+    # without pings, the up heartbeats have the ping 100 + i and the other heartbeats no ping
+    r = []
+    for i, status in enumerate(statuses):
+        if pings is not None:
+            ping = pings[i]
+        else:
+            ping = 100 + i if status == MonitorStatus.UP else None
+        r.append({
+            "monitorID": monitor_id,
+            "status": status,
+            "time": format_heartbeat_time(start + offset + interval * i),
+            "msg": "200 - OK" if status == MonitorStatus.UP else "timeout",
+            "ping": ping,
+            "important": i == 0 or status != statuses[i - 1],
+            "duration": interval
+        })
+    return r
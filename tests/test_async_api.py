@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+from uptime_kuma_api import AsyncUptimeKumaApi, UptimeKumaException, MonitorType
+from uptime_kuma_test_case import UptimeKumaTestCase
+
+
+class TestAsyncApi(UptimeKumaTestCase):
+    def test_async_api(self):
+        async def run():
+            async with AsyncUptimeKumaApi(self.url) as api:
+                await api.login(self.username, self.password)
+
+                # add monitors concurrently
+                r = await asyncio.gather(*[
+                    api.add_monitor(
+                        type=MonitorType.HTTP,
+                        name=f"monitor {i}",
+                        url="http://127.0.0.1"
+                    ) for i in range(3)
+                ])
+                monitor_ids = [i["monitorID"] for i in r]
+
+                # get monitors
+                monitors = await api.get_monitors()
+                self.assertEqual(sorted(i["id"] for i in monitors), sorted(monitor_ids))
+                monitor = await api.get_monitor(monitor_ids[0])
+                self.assertEqual(monitor["type"], MonitorType.HTTP)
+
+                # edit monitor
+                r = await api.edit_monitor(monitor_ids[0], name="monitor 0 new")
+                self.assertEqual(r["msg"], "Saved.")
+
+                # delete monitor
+                r = await api.delete_monitor(monitor_ids[0])
+                self.assertEqual(r["msg"], "Deleted Successfully.")
+                with self.assertRaises(UptimeKumaException):
+                    await api.get_monitor(monitor_ids[0])
+
+        asyncio.run(run())
+
+    def test_async_api_status_page(self):
+        async def run():
+            async with AsyncUptimeKumaApi(self.url) as api:
+                await api.login(self.username, self.password)
+
+                # capabilities wait for the server version
+                capabilities = await api.capabilities
+                self.assertEqual(await api.version, capabilities.version)
+
+                # add and save status page
+                slug = "slug-async"
+                await api.add_status_page(slug, "status page async")
+                r = await api.save_status_page(slug, description="description async")
+                self.assertIn("publicGroupList", r)
+                status_page = await api.get_status_page(slug)
+                self.assertEqual(status_page["description"], "description async")
+
+                # settings
+                settings = await api.get_settings()
+                r = await api.set_settings(self.password, keepDataPeriodDays=settings["keepDataPeriodDays"])
+                self.assertEqual(r["msg"], "Saved")
+
+                # delete status page
+                await api.delete_status_page(slug)
+                self.assertNotIn(slug, [i["slug"] for i in await api.get_status_pages()])
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
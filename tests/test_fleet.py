@@ -0,0 +1,38 @@
+import unittest
+
+from uptime_kuma_api import UptimeKumaException, UptimeKumaFleet
+from uptime_kuma_test_case import UptimeKumaTestCase
+
+
+class TestFleet(UptimeKumaTestCase):
+    def test_fleet(self):
+        monitor_id = self.add_monitor()
+
+        instances = {
+            "instance 1": {"url": self.url, "username": self.username, "password": self.password},
+            "instance 2": {"url": self.url, "username": self.username, "password": self.password},
+            "instance 3": {"url": "http://127.0.0.1:1", "username": self.username, "password": self.password}
+        }
+        with UptimeKumaFleet(instances) as fleet:
+            self.assertEqual(list(fleet), ["instance 1", "instance 2"])
+            self.assertIsInstance(fleet.connect_errors["instance 3"], UptimeKumaException)
+
+            # fan out
+            r = fleet.call("get_monitor", monitor_id)
+            self.assertEqual(r["instance 1"]["id"], monitor_id)
+            self.assertEqual(r["instance 2"]["id"], monitor_id)
+
+            # partial failure
+            r = fleet.call("get_monitor", 42)
+            self.assertIsInstance(r["instance 1"], UptimeKumaException)
+
+            # merged view
+            monitors = fleet.get_monitors()
+            self.assertEqual(sorted(i["instance"] for i in monitors), ["instance 1", "instance 2"])
+
+            with self.assertRaises(UptimeKumaException):
+                fleet.call("get_monitors", instances=["instance 3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
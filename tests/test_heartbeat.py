@@ -1,6 +1,6 @@
 import unittest
 
-from uptime_kuma_api import MonitorStatus
+from uptime_kuma_api import UptimeKumaApi, MonitorStatus, Event
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -15,6 +15,23 @@ class TestHeartbeat(UptimeKumaTestCase):
         r = self.api.get_important_heartbeats()
         self.assertTrue(type(list(r.values())[0][0]["status"]) == MonitorStatus)
 
+    def test_heartbeat_capacity(self):
+        self.add_monitor()
+        self.api.disconnect()
+        self.api = UptimeKumaApi(self.url, heartbeat_capacity=1, important_heartbeat_capacity=1)
+        self.api.login(self.username, self.password)
+
+        for heartbeats in [self.api.get_heartbeats(), self.api.get_important_heartbeats()]:
+            for monitor_heartbeats in heartbeats.values():
+                self.assertLessEqual(len(monitor_heartbeats), 1)
+
+    def test_subscribe_heartbeats(self):
+        with self.api.subscribe(Event.HEARTBEAT) as subscription:
+            monitor_id = self.add_monitor()
+            heartbeat = subscription.get(timeout=10)
+        self.assertEqual(heartbeat["monitorID"], monitor_id)
+        self.assertTrue(type(heartbeat["status"]) == MonitorStatus)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from heartbeat_helpers import heartbeats
+from uptime_kuma_api import HeartbeatArchive, MonitorStatus
+
+
+class Api(object):
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, callback):
+        self.listeners.append(callback)
+
+    def off(self, event, callback):
+        self.listeners.remove(callback)
+
+
+class TestHeartbeatArchive(unittest.TestCase):
+    def test_heartbeat_archive(self):
+        with HeartbeatArchive(":memory:", batch_size=3) as archive:
+            data = heartbeats([1] * 10, interval=1)
+            archive.extend(data)
+            archive.extend(heartbeats([0], monitor_id=2, interval=1))
+            # archived heartbeats are ignored
+            archive.extend(data[:1])
+            self.assertEqual(archive.count(), 11)
+            self.assertEqual(archive.monitor_ids(), [1, 2])
+
+            beats = archive.get_beats(1, "2023-01-01 00:00:02", "2023-01-01 00:00:08")
+            self.assertEqual([i["time"][-6:] for i in beats], [f"{i:02}.000" for i in range(2, 9)])
+            self.assertEqual(beats[0], data[2])
+            self.assertEqual(archive.get_beats(2)[0]["status"], MonitorStatus.DOWN)
+
+            segment = archive.export(1, "2023-01-01 00:00:02", "2023-01-01 00:00:08")
+            self.assertEqual(segment.decode(), beats)
+
+            self.assertEqual(archive.prune("2023-01-01 00:00:05", monitor_id=1), 5)
+            self.assertEqual(archive.count(1), 5)
+
+    def test_attach(self):
+        api = Api()
+        archive = HeartbeatArchive(":memory:")
+        archive.attach(api)
+        for heartbeat in heartbeats([1] * 5, interval=1):
+            api.listeners[0](heartbeat)
+        archive.flush()
+        self.assertEqual(archive.count(1), 5)
+
+        archive.close()
+        self.assertEqual(api.listeners, [])
+
+    def test_write_error(self):
+        archive = HeartbeatArchive(":memory:", batch_size=1)
+        data = heartbeats([1] * 2, interval=1)
+        # the message cannot be stored, the writer logs the batch and continues
+        with self.assertLogs("uptime_kuma_api.heartbeat_archive"):
+            archive.append(dict(data[0], msg={}))
+            archive.flush()
+        archive.append(data[1])
+        archive.flush()
+        self.assertEqual(archive.count(1), 1)
+        archive.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from heartbeat_helpers import heartbeats
+from uptime_kuma_api import HeartbeatColumns
+
+
+class TestHeartbeatColumns(unittest.TestCase):
+    def test_heartbeat_columns(self):
+        data = heartbeats([1, 1, 1, 0], interval=1)
+        columns = HeartbeatColumns(data)
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(list(columns), data)
+        self.assertEqual(columns.statuses().tolist(), [1, 1, 1, 0])
+        self.assertEqual(columns.times()[0], 1672531200.0)
+        self.assertIs(columns.msgs()[0], columns.msgs()[1])
+
+    def test_maxlen(self):
+        columns = HeartbeatColumns(maxlen=3)
+        columns.extend(heartbeats([1] * 10, interval=1, pings=range(10)))
+        self.assertEqual(columns.pings().tolist(), [7.0, 8.0, 9.0])
+        self.assertEqual(columns[-1]["time"], "2023-01-01 00:00:09.000")
+
+    def test_views_are_not_changed(self):
+        data = heartbeats([1] * 4, interval=1, pings=range(4))
+        columns = HeartbeatColumns(data[:3], maxlen=3)
+        pings = columns.pings()
+        snapshot = columns.snapshot()
+        columns.append(data[3])
+        self.assertEqual(pings.tolist(), [0.0, 1.0, 2.0])
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(columns.pings().tolist(), [1.0, 2.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from heartbeat_helpers import heartbeats, start
+from uptime_kuma_api import HeartbeatIndex
+
+
+class TestHeartbeatIndex(unittest.TestCase):
+    def test_query(self):
+        index = HeartbeatIndex()
+        index.extend(heartbeats([1, 1, 0, 0, 1, 3, 1, 2]))
+        index.extend(heartbeats([0], monitor_id=2))
+        self.assertEqual(index.monitor_ids(), [1, 2])
+
+        r = index.query(1)
+        self.assertEqual(r["count"], 8)
+        # maintenance heartbeats count as up, pending heartbeats as down
+        self.assertEqual(r["up_count"], 5)
+        self.assertEqual(r["down_count"], 3)
+        self.assertEqual(r["uptime"], 5 / 8)
+        self.assertEqual(r["ping_mean"], (100 + 101 + 104 + 106) / 4)
+
+        r = index.query(1, start + 60, start + 180)
+        self.assertEqual(r["count"], 3)
+        self.assertEqual(r["up_count"], 1)
+        self.assertEqual(r["down_duration"], 120)
+        self.assertEqual(r["ping_mean"], 101)
+
+        r = index.query(1, start + 1000, start + 2000)
+        self.assertEqual(r["count"], 0)
+        self.assertIsNone(r["uptime"])
+        self.assertEqual(index.query(3)["count"], 0)
+
+    def test_append(self):
+        index = HeartbeatIndex(maxlen=10)
+        data = heartbeats([1] * 50)
+        index.extend(data)
+        # heartbeats that are already indexed are ignored
+        index.extend(data[:20])
+        r = index.query(1)
+        self.assertLess(r["count"], 20)
+        self.assertEqual(index.query(1, data[40]["time"])["count"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
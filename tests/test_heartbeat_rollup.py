@@ -0,0 +1,85 @@
+import unittest
+
+from heartbeat_helpers import heartbeats, start
+from uptime_kuma_api import HeartbeatRollup
+
+
+class TestHeartbeatRollup(unittest.TestCase):
+    def test_query(self):
+        rollup = HeartbeatRollup()
+        rollup.extend(heartbeats([1, 1, 0, 0, 1, 3, 1, 2]))
+        rollup.extend(heartbeats([0], monitor_id=2))
+        self.assertEqual(rollup.monitor_ids(), [1, 2])
+
+        r = rollup.query(1, start, start + 600)
+        self.assertEqual(r["resolution"], 60)
+        self.assertEqual(len(r["buckets"]), 8)
+        self.assertEqual(r["buckets"][2]["down_count"], 1)
+        self.assertIsNone(r["buckets"][2]["ping_mean"])
+
+        r = rollup.query(1, start, resolution=300)
+        self.assertEqual([i["count"] for i in r["buckets"]], [5, 3])
+        bucket = r["buckets"][0]
+        self.assertEqual(bucket["start"], start)
+        self.assertEqual(bucket["up_count"], 3)
+        self.assertEqual(bucket["uptime"], 3 / 5)
+        self.assertEqual(bucket["ping_min"], 100)
+        self.assertEqual(bucket["ping_max"], 104)
+        self.assertEqual(bucket["ping_mean"], (100 + 101 + 104) / 3)
+        # maintenance heartbeats count as up, pending heartbeats as down
+        self.assertEqual(r["buckets"][1]["up_count"], 2)
+        self.assertEqual(r["buckets"][1]["down_count"], 1)
+
+    def test_duplicate_times_bounded(self):
+        rollup = HeartbeatRollup({60: 10, 300: 20, 3600: 10})
+        rollup.extend(heartbeats([1] * 20000, interval=20))
+        # only the times of the heartbeats in the kept 1 minute buckets are remembered
+        self.assertLessEqual(sum(len(i) for i in rollup._times[1].values()), 10 * 3)
+        self.assertEqual(rollup.query(1, start, resolution=3600)["buckets"][-1]["count"], 20000 % 180)
+
+        # a window with more than max_buckets 1 minute buckets uses the 5 minute buckets
+        r = rollup.query(1, start, start + 600, max_buckets=5)
+        self.assertEqual(r["resolution"], 300)
+
+        self.assertEqual(rollup.query(3, start)["buckets"], [])
+        with self.assertRaises(ValueError):
+            rollup.query(1, start, resolution=120)
+
+    def test_eviction(self):
+        rollup = HeartbeatRollup({60: 10, 300: 20, 3600: 10})
+        rollup.extend(heartbeats([1] * 60))
+        r = rollup.query(1, start + 3000)
+        self.assertEqual(r["resolution"], 60)
+        self.assertEqual(len(r["buckets"]), 10)
+
+        # the 1 minute buckets do not cover the window anymore
+        r = rollup.query(1, start)
+        self.assertEqual(r["resolution"], 300)
+        self.assertEqual(sum(i["count"] for i in r["buckets"]), 60)
+
+        # a late heartbeat older than the kept 1 minute buckets is ignored
+        rollup.append(heartbeats([1], offset=30)[0])
+        self.assertEqual(rollup.query(1, start, resolution=60)["buckets"][0]["start"], start + 3000)
+        self.assertEqual(rollup.query(1, start, resolution=300)["buckets"][0]["count"], 5)
+
+    def test_duplicates(self):
+        rollup = HeartbeatRollup({60: 10, 300: 20})
+        data = heartbeats([1, 0, 1, 1], interval=600)
+        rollup.extend(data[2:])
+        rollup.extend(data)
+        # the heartbeats that are already added are ignored, the late heartbeats fill the gap
+        r = rollup.query(1, start, resolution=60)
+        self.assertEqual([i["start"] for i in r["buckets"]], [start + 600 * i for i in range(4)])
+        self.assertEqual([i["count"] for i in r["buckets"]], [1, 1, 1, 1])
+        self.assertEqual(r["buckets"][1]["down_count"], 1)
+
+    def test_duplicate_times_bounded(self):
+        rollup = HeartbeatRollup({60: 10, 300: 20, 3600: 10})
+        rollup.extend(heartbeats([1] * 20000, interval=20))
+        # only the times of the heartbeats in the kept 1 minute buckets are remembered
+        self.assertLessEqual(sum(len(i) for i in rollup._times[1].values()), 10 * 3)
+        self.assertEqual(rollup.query(1, start, resolution=3600)["buckets"][-1]["count"], 20000 % 180)
+
+
+if __name__ == '__main__':
+    unittest.main()
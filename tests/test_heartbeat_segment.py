@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from heartbeat_helpers import heartbeats, start
+from uptime_kuma_api import HeartbeatSegment, MonitorStatus
+
+
+def beats(count):
+    # every tenth heartbeat is down, the times have milliseconds
+    statuses = [MonitorStatus.DOWN if i % 10 == 9 else MonitorStatus.UP for i in range(count)]
+    return heartbeats(statuses, interval=20, offset=0.123)
+
+
+class TestHeartbeatSegment(unittest.TestCase):
+    def test_encode(self):
+        data = beats(1000)
+        segment = HeartbeatSegment.encode(data, block_size=64)
+        self.assertEqual(segment.monitor_id, 1)
+        self.assertEqual(len(segment), 1000)
+        self.assertEqual(segment.decode(), data)
+
+        # the segment is read from its bytes
+        segment = HeartbeatSegment(segment.data)
+        self.assertEqual(list(segment), data)
+
+        self.assertEqual(HeartbeatSegment.encode([]).decode(), [])
+        with self.assertRaises(ValueError):
+            HeartbeatSegment(b"invalid")
+
+    def test_encode_unsorted(self):
+        data = beats(100)
+        # the heartbeats are sorted by time before the time deltas are encoded
+        segment = HeartbeatSegment.encode(data[50:] + data[:50], block_size=64)
+        self.assertEqual(segment.decode(), data)
+
+    def test_iter_range(self):
+        data = beats(1000)
+        segment = HeartbeatSegment.encode(data, block_size=64)
+        r = list(segment.iter_range(start + 20 * 100, start + 20 * 300 + 1))
+        self.assertEqual(r, data[100:301])
+
+    def test_open(self):
+        data = beats(100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "segment")
+            HeartbeatSegment.encode(data).write(path)
+            with HeartbeatSegment.open(path) as segment:
+                self.assertEqual(segment.decode(), data)
+            self.assertTrue(segment.data.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import unittest
+
+from uptime_kuma_api import HttpCache
+
+
+class Response(object):
+    def __init__(self, status_code, headers=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+        self.ok = status_code < 400
+        self.parsed = 0
+
+    def json(self):
+        self.parsed += 1
+        return json.loads(self.text)
+
+
+class Session(object):
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers))
+        if headers.get("If-None-Match") == '"1"':
+            return Response(304)
+        return Response(200, {"ETag": '"1"'}, json.dumps({"url": url}))
+
+
+class TestHttpCache(unittest.TestCase):
+    def test_revalidate(self):
+        session = Session()
+        cache = HttpCache()
+
+        r1 = cache.get(session, "http://127.0.0.1/a")
+        r2 = cache.get(session, "http://127.0.0.1/a")
+        self.assertIs(r1, r2)
+        self.assertEqual(session.requests[1][1], {"If-None-Match": '"1"'})
+
+        cache.invalidate("http://127.0.0.1/a")
+        cache.get(session, "http://127.0.0.1/a")
+        self.assertEqual(session.requests[2][1], {})
+
+    def test_json(self):
+        session = Session()
+        cache = HttpCache()
+
+        r1, data1 = cache.get_json(session, "http://127.0.0.1/a")
+        data1["url"] = "modified"
+        r2, data2 = cache.get_json(session, "http://127.0.0.1/a")
+        self.assertIs(r1, r2)
+        self.assertEqual(data2, {"url": "http://127.0.0.1/a"})
+
+        # the body is parsed once, the 304 response returns a copy of the parsed body
+        self.assertEqual(r1.parsed, 1)
+
+    def test_ttl(self):
+        session = Session()
+        cache = HttpCache(ttl=60)
+
+        cache.get(session, "http://127.0.0.1/a")
+        cache.get(session, "http://127.0.0.1/a")
+        self.assertEqual(len(session.requests), 1)
+
+    def test_lru(self):
+        session = Session()
+        cache = HttpCache(maxsize=2)
+
+        cache.get(session, "http://127.0.0.1/a")
+        cache.get(session, "http://127.0.0.1/b")
+        cache.get(session, "http://127.0.0.1/a")
+        cache.get(session, "http://127.0.0.1/c")
+        self.assertEqual(len(cache), 2)
+
+        # b is the least recently used response
+        cache.get(session, "http://127.0.0.1/b")
+        self.assertEqual(session.requests[-1][1], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,11 @@ class TestInfo(UptimeKumaTestCase):
         info = self.api.info()
         self.assertIn("version", info)
 
+    def test_capabilities(self):
+        capabilities = self.api.capabilities
+        self.assertEqual(capabilities.version, self.api.info()["version"])
+        self.assertIs(capabilities, self.api.capabilities)
+
 
 if __name__ == '__main__':
     unittest.main()
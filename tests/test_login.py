@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from uptime_kuma_api import UptimeKumaApi
@@ -26,6 +27,39 @@ class TestLogin(UptimeKumaTestCase):
         r = self.api.get_settings()
         self.assertFalse(r["disableAuth"])
 
+    def test_wait_for_sync(self):
+        self.add_monitor()
+
+        # login again to receive the initial messages
+        self.api.disconnect()
+        self.api = UptimeKumaApi(self.url)
+        self.api.login(self.username, self.password)
+        self.api.wait_for_sync()
+
+        monitors = self.api.get_monitors()
+        heartbeats = self.api.get_heartbeats()
+        for monitor in monitors:
+            self.assertIn(monitor["id"], heartbeats)
+
+    def test_reconnect(self):
+        self.add_monitor()
+        self.api.wait_for_sync()
+        self.assertEqual(self.api.generation, 1)
+
+        # drop the connection, the client reconnects and logs in again
+        self.api.sio.eio.ws.close()
+        for _ in range(100):
+            if self.api.generation == 2:
+                break
+            time.sleep(0.1)
+        self.assertEqual(self.api.generation, 2)
+
+        self.api.wait_for_sync()
+        monitors = self.api.get_monitors()
+        self.assertEqual(len(monitors), 1)
+        r = self.api.pause_monitor(monitors[0]["id"])
+        self.assertEqual(r["msg"], "Paused Successfully.")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import time
 import unittest
 from packaging.version import parse as parse_version
 
@@ -66,6 +67,11 @@ class TestMonitor(UptimeKumaTestCase):
         r = self.api.get_monitor_beats(monitor_id, 6)
         self.assertTrue(type(r[0]["status"]) == MonitorStatus)
 
+        # iterate over monitor beats
+        beats = list(self.api.iter_monitor_beats(monitor_id, time.time() - 6 * 3600))
+        self.assertEqual([i["id"] for i in beats], [i["id"] for i in r])
+        self.assertTrue(type(beats[0]["status"]) == MonitorStatus)
+
         # delete monitor
         r = self.api.delete_monitor(monitor_id)
         self.assertEqual(r["msg"], "Deleted Successfully.")
@@ -371,6 +377,103 @@ class TestMonitor(UptimeKumaTestCase):
         }
         self.do_test_monitor_type(expected_monitor)
 
+    def test_get_monitors_snapshot(self):
+        monitor_id = self.add_monitor()
+
+        monitors = self.api.get_monitors(copy=False)
+        self.assertIs(monitors, self.api.get_monitors(copy=False))
+        monitor = self.find_by_id(monitors, monitor_id)
+        self.assertTrue(type(monitor["type"]) == MonitorType)
+        with self.assertRaises(TypeError):
+            monitor["name"] = "monitor 1 new"
+
+        # the snapshot is replaced when the monitor list changes
+        self.add_monitor("monitor 2")
+        self.assertEqual(len(self.api.get_monitors(copy=False)), 2)
+        self.assertEqual(len(monitors), 1)
+
+    def test_add_monitors(self):
+        monitors = [
+            {
+                "type": MonitorType.HTTP,
+                "name": f"monitor {i}",
+                "url": "http://127.0.0.1"
+            } for i in range(5)
+        ]
+        r = self.api.add_monitors(monitors, concurrency=2)
+        self.assertEqual(len(r), 5)
+        monitor_ids = [i["monitorID"] for i in r]
+
+        # the monitor list contains all new monitors without waiting for another event
+        monitors = self.api.get_monitors()
+        for i, monitor_id in enumerate(monitor_ids):
+            monitor = self.find_by_id(monitors, monitor_id)
+            self.assertEqual(monitor["name"], f"monitor {i}")
+
+        # nothing is added if a monitor is invalid
+        with self.assertRaises(TypeError):
+            self.api.add_monitors([
+                {
+                    "type": MonitorType.HTTP,
+                    "name": "monitor 6",
+                    "url": "http://127.0.0.1"
+                },
+                {
+                    "type": MonitorType.HTTP,
+                    "name": "monitor 7"
+                }
+            ])
+        self.assertEqual(len(self.api.get_monitors()), 5)
+
+    def test_edit_monitors(self):
+        monitor_id_1 = self.add_monitor("monitor 1")
+        monitor_id_2 = self.add_monitor("monitor 2")
+
+        # monitors without changes are not sent to the server
+        r = self.api.edit_monitor(monitor_id_1, name="monitor 1")
+        self.assertEqual(r["msg"], "Not changed.")
+
+        r = self.api.edit_monitors({
+            monitor_id_1: {
+                "name": "monitor 1"
+            },
+            monitor_id_2: {
+                "name": "monitor 2 new"
+            }
+        })
+        self.assertEqual(r[monitor_id_1]["msg"], "Not changed.")
+        self.assertEqual(r[monitor_id_2]["msg"], "Saved.")
+        monitor = self.api.get_monitor(monitor_id_2)
+        self.assertEqual(monitor["name"], "monitor 2 new")
+
+        # nothing is edited if a monitor is invalid
+        with self.assertRaises(ValueError):
+            self.api.edit_monitors({
+                monitor_id_1: {
+                    "name": "monitor 1 new"
+                },
+                monitor_id_2: {
+                    "interval": 1
+                }
+            })
+        monitor = self.api.get_monitor(monitor_id_1)
+        self.assertEqual(monitor["name"], "monitor 1")
+
+    def test_submit(self):
+        monitor_ids = [self.add_monitor(f"monitor {i}") for i in range(3)]
+
+        futures = [self.api.submit("getMonitorBeats", monitor_id, 6) for monitor_id in monitor_ids]
+        for future in futures:
+            self.assertIsInstance(future.result()["data"], list)
+
+        r = list(self.api.map("getMonitor", monitor_ids))
+        self.assertEqual([i["monitor"]["id"] for i in r], monitor_ids)
+
+        # errors are raised by the future
+        future = self.api.submit("getMonitor", 42)
+        with self.assertRaises(UptimeKumaException):
+            future.result()
+
     def test_delete_not_existing_monitor(self):
         with self.assertRaises(UptimeKumaException):
             self.api.delete_monitor(42)
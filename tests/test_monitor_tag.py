@@ -24,6 +24,14 @@ class TestMonitorTag(UptimeKumaTestCase):
         monitor = self.find_by_id(monitors, monitor_id)
         self.assertEqual(monitor["tags"][0]["tag_id"], tag_id)
 
+        # get monitors by tag
+        monitors = self.api.get_monitors_by_tag(tag_id)
+        self.assertEqual([i["id"] for i in monitors], [monitor_id])
+        monitors = self.api.get_monitors_by_tag(tag_id, "value 1")
+        self.assertEqual([i["id"] for i in monitors], [monitor_id])
+        monitors = self.api.get_monitors_by_tag(tag_id, "value 2")
+        self.assertEqual(monitors, [])
+
         # delete monitor tag
         r = self.api.delete_monitor_tag(**expected_monitor_tag)
         self.assertEqual(r["msg"], "Deleted Successfully.")
@@ -32,6 +40,7 @@ class TestMonitorTag(UptimeKumaTestCase):
         monitors = self.api.get_monitors()
         monitor = self.find_by_id(monitors, monitor_id)
         self.assertEqual(monitor["tags"], [])
+        self.assertEqual(self.api.get_monitors_by_tag(tag_id), [])
 
     def test_delete_not_existing_monitor_tag(self):
         with self.assertRaises(UptimeKumaException):
@@ -0,0 +1,72 @@
+import random
+import unittest
+
+from heartbeat_helpers import heartbeats, start
+from uptime_kuma_api import QuantileSketch, WindowedQuantileSketch, LatencySketches
+
+
+def exact_quantile(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_quantile(self):
+        random.seed(1)
+        values = [random.lognormvariate(5, 1) for _ in range(10000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0, 0.5, 0.95, 0.99, 1):
+            expected = exact_quantile(values, q)
+            self.assertLessEqual(abs(sketch.quantile(q) - expected), 0.01 * expected)
+        self.assertEqual(sketch.count, 10000)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+    def test_merge(self):
+        a = QuantileSketch()
+        b = QuantileSketch()
+        for i in range(1, 1001):
+            (a if i % 2 else b).add(i)
+        a.merge(b)
+        self.assertEqual(a.count, 1000)
+        self.assertLessEqual(abs(a.quantile(0.9) - 900), 9)
+
+        with self.assertRaises(ValueError):
+            a.merge(QuantileSketch(relative_accuracy=0.02))
+
+    def test_max_buckets(self):
+        sketch = QuantileSketch(max_buckets=10)
+        for i in range(1, 10000):
+            sketch.add(i)
+        self.assertLessEqual(len(sketch._buckets), 10)
+        self.assertLessEqual(abs(sketch.quantile(0.99) - 9899), 99)
+
+    def test_window(self):
+        sketch = WindowedQuantileSketch(3600, slots=6)
+        sketch.add(1000, start)
+        self.assertEqual(sketch.sketch(start + 3500).count, 1)
+        for i in range(60):
+            sketch.add(10, start + 3600 + i * 60)
+        # the first value is dropped with its slot
+        self.assertEqual(sketch.sketch(start + 2 * 3600).max, 10)
+
+    def test_latency_sketches(self):
+        sketches = LatencySketches(windows=(3600,))
+        for monitor_id in (1, 2):
+            pings = [monitor_id * 100 if i % 10 else None for i in range(60)]
+            sketches.extend(heartbeats([1] * 60, monitor_id=monitor_id, pings=pings))
+        now = start + 3599
+        self.assertEqual(sketches.monitor_ids(), [1, 2])
+        self.assertEqual(sketches.sketch(1, 3600, now).count, 54)
+        self.assertLessEqual(abs(sketches.quantiles(2, 3600, now=now)[0.5] - 200), 2)
+        merged = sketches.merged(3600, now=now)
+        self.assertEqual(merged.count, 108)
+        self.assertLessEqual(abs(merged.quantile(0.99) - 200), 2)
+
+        with self.assertRaises(ValueError):
+            sketches.sketch(1, 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
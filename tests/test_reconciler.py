@@ -0,0 +1,129 @@
+import unittest
+
+from uptime_kuma_api import UptimeKumaApi, UptimeKumaException, MonitorType, NotificationType, Reconciler
+from uptime_kuma_test_case import UptimeKumaTestCase
+
+
+class TestReconciler(UptimeKumaTestCase):
+    def test_reconciler(self):
+        state = {
+            "notifications": [
+                {
+                    "name": "notification 1",
+                    "type": NotificationType.PUSHBYTECHULUS,
+                    "pushAPIKey": "123456789"
+                }
+            ],
+            "tags": [
+                {
+                    "name": "tag 1",
+                    "color": "#ffffff"
+                }
+            ],
+            "monitors": [
+                {
+                    "type": MonitorType.GROUP,
+                    "name": "group 1"
+                },
+                {
+                    "type": MonitorType.HTTP,
+                    "name": "monitor 1",
+                    "url": "http://127.0.0.1",
+                    "parent": "group 1",
+                    "notificationIDList": ["notification 1"],
+                    "tags": [
+                        {
+                            "name": "tag 1",
+                            "value": "value 1"
+                        }
+                    ]
+                }
+            ]
+        }
+        reconciler = Reconciler(self.api)
+
+        # add the desired state
+        plan = reconciler.plan(state)
+        self.assertEqual([len(i) for i in plan.waves], [2, 1, 1, 1])
+        reconciler.apply(plan)
+        self.assertEqual(plan.errors, [])
+
+        monitors = self.api.get_monitors()
+        group = self.find_by_id(monitors, "group 1", "name")
+        monitor = self.find_by_id(monitors, "monitor 1", "name")
+        notification = self.api.get_notifications()[0]
+        self.assertEqual(monitor["parent"], group["id"])
+        self.assertEqual(monitor["notificationIDList"], [notification["id"]])
+        self.assertEqual(monitor["tags"][0]["value"], "value 1")
+
+        # nothing changes if the state is reached
+        plan = reconciler.plan(state)
+        self.assertEqual(len(plan), 0)
+
+        # only the changed monitor is edited
+        state["monitors"][1]["interval"] = 120
+        plan = reconciler.plan(state)
+        self.assertEqual([str(i) for i in plan.operations], ["~ edit monitor 'monitor 1' (interval)"])
+        reconciler.apply(plan)
+        monitor = self.api.get_monitor(monitor["id"])
+        self.assertEqual(monitor["interval"], 120)
+
+        # entities that are not in the desired state are deleted
+        state["monitors"] = state["monitors"][:1]
+        reconciler = Reconciler(self.api, prune=True)
+        reconciler.reconcile(state)
+        monitors = self.api.get_monitors()
+        self.assertEqual([i["name"] for i in monitors], ["group 1"])
+
+    def test_reconciler_after_login(self):
+        # plan before the info event with the server capabilities has been received
+        self.api.disconnect()
+        self.api = UptimeKumaApi(self.url)
+        self.api.login(self.username, self.password)
+        plan = Reconciler(self.api).plan({
+            "monitors": [
+                {
+                    "type": MonitorType.HTTP,
+                    "name": "monitor 1",
+                    "url": "http://127.0.0.1"
+                }
+            ],
+            "status_pages": [
+                {
+                    "slug": "slug1",
+                    "title": "status page 1"
+                }
+            ]
+        })
+        self.assertEqual([i.resource for i in plan.operations], ["monitor", "status_page"])
+
+    def test_reconciler_invalid_state(self):
+        reconciler = Reconciler(self.api)
+
+        with self.assertRaises(UptimeKumaException):
+            reconciler.plan({
+                "monitors": [
+                    {
+                        "type": MonitorType.HTTP,
+                        "name": "monitor 1",
+                        "url": "http://127.0.0.1",
+                        "parent": "group 1"
+                    }
+                ]
+            })
+
+        with self.assertRaises(ValueError):
+            reconciler.plan({
+                "monitors": [
+                    {
+                        "type": MonitorType.HTTP,
+                        "name": "monitor 1",
+                        "url": "http://127.0.0.1",
+                        "interval": 1
+                    }
+                ]
+            })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from heartbeat_helpers import heartbeats, start
+from uptime_kuma_api import HeartbeatColumns, business_hours, compute_sla, compute_slas
+from uptime_kuma_api import sla
+
+
+def beats(statuses):
+    # the first beat covers the first minute after start
+    return heartbeats(statuses, offset=60)
+
+
+class TestSla(unittest.TestCase):
+    def setUp(self):
+        self.numpy = sla.np
+
+    def tearDown(self):
+        sla.np = self.numpy
+
+    def compute(self, *args, **kwargs):
+        r = compute_sla(*args, **kwargs)
+        if sla.np is not None:
+            # the pure python fallback computes the same result
+            sla.np = None
+            self.assertEqual(compute_sla(*args, **kwargs), r)
+            sla.np = self.numpy
+        return r
+
+    def test_compute_sla(self):
+        data = beats([1, 1, 0, 0, 1, 2, 1, 0, 3, 1])
+        r = self.compute(data)
+        # maintenance beats count as up, pending beats as down
+        self.assertEqual(r["up_duration"], 6 * 60)
+        self.assertEqual(r["down_duration"], 4 * 60)
+        self.assertEqual(r["uptime"], 6 / 10)
+        self.assertEqual(r["incidents"], 2)
+        self.assertEqual(r["beats"], 10)
+        self.assertEqual(r["ping_mean"], (100 + 101 + 104 + 106 + 109) / 5)
+        self.assertEqual(r["ping_percentiles"][50], 104)
+
+        # the columns compute the same result as the dicts
+        self.assertEqual(self.compute(HeartbeatColumns(data)), r)
+        self.assertEqual(compute_slas({1: data}), {1: r})
+
+    def test_compute_sla_window(self):
+        data = beats([0, 0, 1, 1, 1, 1])
+        # the first two beats are excluded, half of the last beat is outside of the window
+        r = self.compute(data, start=start + 120, end=start + 330, exclude=[(start + 180, start + 240)])
+        self.assertEqual(r["down_duration"], 0)
+        self.assertEqual(r["up_duration"], 150)
+        self.assertEqual(r["uptime"], 1)
+        self.assertEqual(r["beats"], 2)
+
+        r = self.compute(data, include=[(start + 3600, start + 7200)])
+        self.assertIsNone(r["uptime"])
+        self.assertIsNone(r["ping_mean"])
+
+    def test_business_hours(self):
+        # monday 2023-01-02 and tuesday 2023-01-03
+        r = business_hours(start, start + 4 * 86400, hours=(9, 17.5))
+        self.assertEqual(r, [
+            (start + 86400 + 9 * 3600, start + 86400 + 17.5 * 3600),
+            (start + 2 * 86400 + 9 * 3600, start + 2 * 86400 + 17.5 * 3600),
+            (start + 3 * 86400 + 9 * 3600, start + 3 * 86400 + 17.5 * 3600)
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
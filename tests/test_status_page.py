@@ -1,6 +1,6 @@
 import unittest
 
-from uptime_kuma_api import UptimeKumaException, IncidentStyle
+from uptime_kuma_api import UptimeKumaException, IncidentStyle, BadgeType
 from uptime_kuma_test_case import UptimeKumaTestCase
 
 
@@ -57,6 +57,14 @@ class TestStatusPage(UptimeKumaTestCase):
         expected_status_page_config = {i: expected_status_page[i] for i in expected_status_page if i != "publicGroupList"}
         self.compare(status_page, expected_status_page_config)
 
+        # get status page heartbeats
+        r = self.api.get_status_page_heartbeats(slug)
+        self.assertIn(monitor_id, r["heartbeatList"])
+
+        # get badge
+        badge = self.api.get_badge(monitor_id, BadgeType.UPTIME, 24)
+        self.assertTrue(badge.startswith("<svg"))
+
         # edit status page
         expected_status_page["title"] = "status page 1 new"
         expected_status_page["theme"] = "dark"
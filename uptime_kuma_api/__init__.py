@@ -5,8 +5,23 @@ from .monitor_type import MonitorType
 from .notification_providers import NotificationType, notification_provider_options, notification_provider_conditions
 from .proxy_protocol import ProxyProtocol
 from .incident_style import IncidentStyle
+from .badge_type import BadgeType
 from .docker_type import DockerType
 from .maintenance_strategy import MaintenanceStrategy
+from .overflow_policy import OverflowPolicy
 from .exceptions import UptimeKumaException, Timeout
 from .event import Event
+from .heartbeat_columns import HeartbeatColumns
+from .heartbeat_archive import HeartbeatArchive
+from .heartbeat_segment import HeartbeatSegment
+from .heartbeat_index import HeartbeatIndex
+from .quantile_sketch import QuantileSketch, WindowedQuantileSketch, LatencySketches
+from .heartbeat_rollup import HeartbeatRollup
+from .subscription import Subscription
+from .server_capabilities import ServerCapabilities
+from .http_cache import HttpCache
+from .sla import business_hours, compute_sla, compute_slas
 from .api import UptimeKumaApi
+from .async_api import AsyncUptimeKumaApi
+from .fleet import UptimeKumaFleet
+from .reconciler import Reconciler, ReconcilePlan, ReconcileOperation
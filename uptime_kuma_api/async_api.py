@@ -0,0 +1,1711 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable
+
+import requests
+import socketio
+
+from . import (
+    BadgeType,
+    Event,
+    HeartbeatColumns,
+    HttpCache,
+    IncidentStyle,
+    MonitorStatus,
+    ServerCapabilities,
+    Timeout,
+    UptimeKumaException
+)
+from .api import (
+    BaseUptimeKumaApi,
+    _badge_path,
+    _build_docker_host_data,
+    _build_notification_data,
+    _build_proxy_data,
+    _build_tag_data,
+    _check_arguments_maintenance,
+    _check_arguments_notification,
+    _check_arguments_proxy,
+    _check_arguments_tag,
+    _check_response,
+    _convert_api_key_list_return,
+    _convert_badge_return,
+    _convert_docker_host_input,
+    _convert_docker_host_list_return,
+    _convert_heartbeat_list_return,
+    _convert_maintenance_list_return,
+    _convert_monitor_list_return,
+    _convert_notification_list_return,
+    _convert_proxy_list_return,
+    _convert_status_page_heartbeats_return,
+    _convert_status_page_list_return,
+    _convert_status_page_return,
+    _create_http_session,
+    _iter_monitor_beats_return,
+    _merge_monitor_edit_data,
+    _merge_monitor_edit_results,
+    _merge_notification_edit_data,
+    _monitor_beats_window,
+    int_to_bool,
+    parse_incident_style,
+    parse_maintenance_strategy,
+    parse_monitor_status
+)
+from .docstrings import append_docstring, copy_docstring
+
+
+async def _gather_concurrently(func, items, concurrency) -> list:
+    # awaits func for each item with at most concurrency calls at the same time
+    # returns the results in the order of the items, a failed call returns its exception
+    if concurrency < 1:
+        raise ValueError("the value of concurrency must not be less than 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+    return await asyncio.gather(*[run(item) for item in items], return_exceptions=True)
+
+
+class AsyncUptimeKumaApi(BaseUptimeKumaApi):
+    """This class is used to communicate with Uptime Kuma from asyncio applications.
+
+    It is based on :class:`socketio.AsyncClient` and shares the event cache, the event handlers and the
+    request builders with :class:`UptimeKumaApi`. The methods are coroutines with the same arguments
+    and return values as the methods of :class:`UptimeKumaApi` with the same name.
+    Independent calls can run concurrently with :func:`asyncio.gather`.
+
+    The properties :attr:`~capabilities` and :attr:`~version` must be awaited.
+    The REST endpoints are requested in a thread of the default executor.
+
+    The asyncio client of python-socketio requires aiohttp, which is installed with the ``asyncio`` extra:
+
+    .. code-block:: bash
+
+        pip install uptime-kuma-api[asyncio]
+
+    Example::
+
+        >>> from uptime_kuma_api import AsyncUptimeKumaApi
+        >>> async with AsyncUptimeKumaApi('INSERT_URL') as api:
+        ...     await api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        ...     monitors, beats = await asyncio.gather(
+        ...         api.get_monitors(),
+        ...         api.get_monitor_beats(1, 6)
+        ...     )
+
+    Without a context manager, :meth:`~connect` and :meth:`~disconnect` must be awaited.
+
+    The parameters are the same as the parameters of :class:`UptimeKumaApi`.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            timeout: float = 10,
+            headers: dict = None,
+            ssl_verify: bool = True,
+            wait_events: float = 0.2,
+            heartbeat_capacity: int = 150,
+            important_heartbeat_capacity: int = 500,
+            columnar_heartbeats: bool = False,
+            max_in_flight: int = 100,
+            reconnect: bool = True,
+            reconnect_delay: float = 1,
+            reconnect_delay_max: float = 30,
+            http_pool_size: int = 10,
+            http_cache_size: int = 128,
+            http_cache_ttl: float = 0
+    ) -> None:
+        super().__init__(
+            socketio.AsyncClient(
+                ssl_verify=ssl_verify,
+                reconnection=reconnect,
+                reconnection_delay=reconnect_delay,
+                reconnection_delay_max=reconnect_delay_max
+            ),
+            url,
+            timeout,
+            headers,
+            wait_events,
+            heartbeat_capacity,
+            important_heartbeat_capacity,
+            columnar_heartbeats
+        )
+
+        # set and replaced when the event data changes, created by the first waiting task
+        self._changed = None
+
+        # limits the requests of submit() that wait for a response, created in the event loop
+        self.max_in_flight = max_in_flight
+        self._in_flight = None
+
+        # set by disconnect(), requests do not wait for a reconnect anymore
+        self._closed = False
+
+        self._session = _create_http_session(ssl_verify, headers, http_pool_size)
+        self._http_cache = HttpCache(http_cache_size, http_cache_ttl)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    def _event_updated(self, event, monitor_id=None, key=None) -> None:
+        super()._event_updated(event, monitor_id, key)
+        # the event handlers are called by the event loop and wake up the waiting tasks
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    def _connection_changed(self) -> None:
+        super()._connection_changed()
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def _wait_for(self, predicate, message, timeout=None) -> None:
+        # waits until the predicate is true, it is checked each time the event data changes
+        async def wait():
+            while not predicate():
+                if self._changed is None:
+                    self._changed = asyncio.Event()
+                await self._changed.wait()
+
+        try:
+            await asyncio.wait_for(wait(), self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            raise Timeout(message)
+
+    async def _wait_for_event(self, event) -> None:
+        await self._wait_for(lambda: self._event_data[event] is not None, f"Timed out while waiting for event {event}")
+
+    @asynccontextmanager
+    async def wait_for_event(self, event: Event) -> AsyncIterator[None]:
+        # waits for the first event of the given type to arrive
+        yield
+        await self._wait_for_event(event)
+
+    async def _wait_for_event_data(self, event) -> bool:
+        # returns False if the event is not sent because there are no monitors
+        await self._wait_for(lambda: self._event_available(event), f"Timed out while waiting for event {event}")
+        if self._event_data[event] is None:
+            return False
+        # wait for multiple messages until the initial sync is complete
+        try:
+            await self._wait_for(lambda: self._synced, None, self.wait_events)
+        except Timeout:
+            pass
+        return True
+
+    async def _get_event_data(self, event, convert=None, copy=True) -> Any:
+        if not await self._wait_for_event_data(event):
+            return []
+        return self._read_event_data(event, convert, copy)
+
+    async def _get_event_entity(self, event, value, key="id", convert=None) -> dict | None:
+        if not await self._wait_for_event_data(event):
+            return None
+        return self._read_event_entity(event, value, key, convert)
+
+    async def _event_entity_exists(self, event, value, key="id") -> bool:
+        if not await self._wait_for_event_data(event):
+            return False
+        return self._contains_event_entity(event, value, key)
+
+    async def _call(self, event, data=None) -> Any:
+        await self._wait_for_connection()
+        r = await self.sio.call(event, data, timeout=self.timeout)
+        return _check_response(r)
+
+    async def _http_get(self, path, params=None) -> requests.Response:
+        # unchanged resources are revalidated and not downloaded again
+        loop = asyncio.get_running_loop()
+        url = self._http_url(path, params)
+        return await loop.run_in_executor(None, self._http_cache.get, self._session, url, self.timeout)
+
+    async def _http_get_json(self, path, params=None) -> tuple[requests.Response, Any]:
+        # the body of an unchanged resource is not parsed again
+        loop = asyncio.get_running_loop()
+        url = self._http_url(path, params)
+        return await loop.run_in_executor(None, self._http_cache.get_json, self._session, url, self.timeout)
+
+    async def _wait_for_connection(self) -> None:
+        # waits while the client reconnects and logs in again
+        if self._connected and not self._relogin_pending:
+            return
+        if self._closed or not self.sio.reconnection:
+            raise UptimeKumaException("not connected")
+        await self._wait_for(
+            lambda: self._closed or (self._connected and not self._relogin_pending),
+            "Timed out while waiting for the reconnect"
+        )
+        if self._closed:
+            raise UptimeKumaException("not connected")
+
+    async def _relogin(self) -> None:
+        # runs in a background task because the event handlers cannot wait for responses
+        try:
+            r = _check_response(await self.sio.call('loginByToken', self._token, timeout=self.timeout))
+        except Exception as e:
+            r = e
+        self._relogin_done(r)
+
+    async def wait_for_sync(self, timeout: float = None) -> None:
+        """
+        Wait until all events that are sent after login have been received.
+
+        See :meth:`.UptimeKumaApi.wait_for_sync`.
+
+        :param float, optional timeout: How many seconds to wait. Defaults to the ``timeout`` of the instance.
+        :raises Timeout: If the initial sync is not completed in time.
+        """
+        await self._wait_for(lambda: self._synced, "Timed out while waiting for the initial sync", timeout)
+
+    def submit(self, event: str, *args) -> asyncio.Task:
+        """
+        Sends a request without waiting for the response. See :meth:`.UptimeKumaApi.submit`.
+
+        At most ``max_in_flight`` requests wait for a response at the same time, further requests are
+        sent when a response arrives.
+
+        :param str event: The name of the Uptime Kuma socket.io event, e.g. ``getMonitorBeats``.
+        :param args: The arguments of the event.
+        :return: A task that returns the server response or raises :class:`UptimeKumaException`
+            if the server returns an error or :class:`Timeout` if no request slot becomes free in time.
+        :rtype: asyncio.Task
+        """
+        if len(args) == 1:
+            data = args[0]
+        else:
+            data = args or None
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        return asyncio.ensure_future(self._submit(event, data))
+
+    async def _submit(self, event, data) -> Any:
+        try:
+            await asyncio.wait_for(self._in_flight.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise Timeout(f"Timed out while waiting to submit event {event}")
+        try:
+            return await self._call(event, data)
+        finally:
+            self._in_flight.release()
+
+    async def map(self, event: str, *iterables) -> AsyncIterator[Any]:
+        """
+        Sends a request for each set of arguments without waiting for the previous responses.
+        See :meth:`.UptimeKumaApi.map`.
+
+        :param str event: The name of the Uptime Kuma socket.io event, e.g. ``getMonitorBeats``.
+        :param iterables: The arguments of the requests.
+        :return: The server responses in the order of the arguments. Raises the exception of a failed request
+            when its response is reached, see :meth:`~submit`.
+        :rtype: AsyncIterator
+
+        Example::
+
+            >>> async for r in api.map("getMonitorBeats", [1, 2], [6, 6]):
+            ...     print(len(r["data"]))
+            360
+            360
+        """
+        tasks = [self.submit(event, *args) for args in zip(*iterables)]
+        for task in tasks:
+            yield await task
+
+    # connection
+
+    async def connect(self) -> None:
+        """
+        Connects to Uptime Kuma.
+
+        :raises UptimeKumaException: When connection to server failed.
+        """
+        # requests wait for reconnects again after a previous disconnect()
+        with self._event_lock:
+            self._closed = False
+        try:
+            await self.sio.connect(f'{self.url}/socket.io/', wait_timeout=self.timeout, headers=self.headers)
+        except:
+            raise UptimeKumaException("unable to connect")
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects from Uptime Kuma.
+        """
+        with self._event_lock:
+            self._closed = True
+            self._connection_changed()
+        await self.sio.disconnect()
+        self._session.close()
+
+    # capabilities
+
+    @property
+    def capabilities(self) -> Awaitable[ServerCapabilities]:
+        """
+        The features of the connected server. See :attr:`.UptimeKumaApi.capabilities`.
+
+        Must be awaited, waits until the server has sent its version.
+
+        :rtype: ServerCapabilities
+        :raises Timeout: If the server version is not received in time.
+
+        Example::
+
+            >>> capabilities = await api.capabilities
+        """
+        return self._get_capabilities()
+
+    async def _get_capabilities(self) -> ServerCapabilities:
+        await self._wait_for_capabilities()
+        return self._capabilities
+
+    async def _wait_for_capabilities(self) -> None:
+        # the request builders depend on the server version
+        await self._wait_for(lambda: self._capabilities is not None, f"Timed out while waiting for event {Event.INFO}")
+
+    @property
+    def version(self) -> Awaitable[str]:
+        """
+        The version of the connected server. Must be awaited.
+
+        :rtype: str
+        :raises Timeout: If the server version is not received in time.
+        """
+        return self._get_version()
+
+    async def _get_version(self) -> str:
+        return (await self._get_capabilities()).version
+
+    # monitor
+
+    @append_docstring(copy_docstring)
+    async def get_monitors(self, copy: bool = True) -> list[dict]:
+        """
+        Get all monitors. See :meth:`.UptimeKumaApi.get_monitors`.
+
+        :return: All monitors.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.MONITOR_LIST, _convert_monitor_list_return, copy)
+
+    async def get_monitor(self, id_: int) -> dict:
+        """
+        Get a monitor. See :meth:`.UptimeKumaApi.get_monitor`.
+
+        :param int id_: The monitor id.
+        :return: The monitor.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = (await self._call('getMonitor', id_))["monitor"]
+        return _convert_monitor_list_return([r])[0]
+
+    async def pause_monitor(self, id_: int) -> dict:
+        """
+        Pauses a monitor. See :meth:`.UptimeKumaApi.pause_monitor`.
+
+        :param int id_: The monitor id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('pauseMonitor', id_)
+
+    async def resume_monitor(self, id_: int) -> dict:
+        """
+        Resumes a monitor. See :meth:`.UptimeKumaApi.resume_monitor`.
+
+        :param int id_: The monitor id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('resumeMonitor', id_)
+
+    async def delete_monitor(self, id_: int) -> dict:
+        """
+        Deletes a monitor. See :meth:`.UptimeKumaApi.delete_monitor`.
+
+        :param int id_: The monitor id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the monitor does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.MONITOR_LIST):
+            if not await self._event_entity_exists(Event.MONITOR_LIST, id_):
+                raise UptimeKumaException("monitor does not exist")
+            return await self._call('deleteMonitor', id_)
+
+    async def get_monitor_beats(self, id_: int, hours: int) -> list[dict]:
+        """
+        Get monitor beats for a specific monitor in a time range. See :meth:`.UptimeKumaApi.get_monitor_beats`.
+
+        :param int id_: The monitor id.
+        :param int hours: Period time in hours from now.
+        :return: The monitor beats.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = (await self._call('getMonitorBeats', (id_, hours)))["data"]
+        int_to_bool(r, ["important"])
+        parse_monitor_status(r)
+        return r
+
+    async def iter_monitor_beats(
+            self,
+            id_: int,
+            start: datetime.datetime | str | float,
+            end: datetime.datetime | str | float = None
+    ) -> AsyncIterator[dict]:
+        """
+        Iterates over the monitor beats of a time window. See :meth:`.UptimeKumaApi.iter_monitor_beats`.
+
+        :param int id_: The monitor id.
+        :param start: The start of the window as datetime, heartbeat time string or unix timestamp.
+        :param end: The end of the window as datetime, heartbeat time string or unix timestamp, defaults to None (now)
+        :return: The monitor beats.
+        :rtype: AsyncIterator
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        start, end, hours = _monitor_beats_window(start, end)
+        beats = (await self._call('getMonitorBeats', (id_, hours)))["data"]
+        for beat in _iter_monitor_beats_return(beats, start, end):
+            yield beat
+
+    async def get_game_list(self) -> list[dict]:
+        """
+        Get a list of games that are supported by the GameDig monitor type. See :meth:`.UptimeKumaApi.get_game_list`.
+
+        :return: The server response.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._call('getGameList')
+        return r.get("gameList")
+
+    async def test_chrome(self, executable) -> dict:
+        """
+        Test if the chrome executable is valid and return the version. See :meth:`.UptimeKumaApi.test_chrome`.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('testChrome', executable)
+
+    async def add_monitor(self, **kwargs) -> dict:
+        """
+        Adds a new monitor. See :meth:`.UptimeKumaApi.add_monitor` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        await self._wait_for_capabilities()
+        data = self._build_monitor_add_data(kwargs)
+        async with self.wait_for_event(Event.MONITOR_LIST):
+            return await self._call('add', data)
+
+    async def add_monitors(self, monitors: list[dict], concurrency: int = 10) -> list[dict | Exception]:
+        """
+        Adds multiple new monitors. See :meth:`.UptimeKumaApi.add_monitors`.
+
+        :param list monitors: The arguments of :meth:`~.UptimeKumaApi.add_monitor` for each monitor.
+        :param int, optional concurrency: How many monitors are added at the same time, defaults to 10
+        :return: The server response for each monitor in the same order as ``monitors``.
+            If a monitor could not be added, the exception is returned instead of the response.
+        :rtype: list
+        :raises TypeError: If an argument of a monitor is missing.
+        :raises ValueError: If an argument of a monitor is invalid.
+        :raises Timeout: If the monitor list with the new monitors is not received.
+        """
+        await self._wait_for_capabilities()
+        monitors_data = [self._build_monitor_add_data(kwargs) for kwargs in monitors]
+        r = await _gather_concurrently(lambda data: self._call('add', data), monitors_data, concurrency)
+        await self._wait_for(lambda: self._monitors_added(r), f"Timed out while waiting for event {Event.MONITOR_LIST}")
+        return r
+
+    async def edit_monitor(self, id_: int, **kwargs) -> dict:
+        """
+        Edits an existing monitor. See :meth:`.UptimeKumaApi.edit_monitor` for the arguments.
+
+        :param int id_: The monitor id.
+        :return: The server response or, if nothing has changed, ``{'monitorID': id_, 'msg': 'Not changed.'}``.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        :raises Timeout: If the monitor list with the edited monitor is not received.
+        """
+        data = await self._build_monitor_edit_data(id_, kwargs)
+        if data is None:
+            return {"monitorID": id_, "msg": "Not changed."}
+        r = await self._edit_monitor(data)
+        await self._wait_for_monitor_edits([id_])
+        return r
+
+    async def edit_monitors(self, monitors: dict[int, dict], concurrency: int = 10) -> dict[int, dict | Exception]:
+        """
+        Edits multiple existing monitors. See :meth:`.UptimeKumaApi.edit_monitors`.
+
+        :param dict monitors: The arguments of :meth:`~.UptimeKumaApi.edit_monitor` by monitor id.
+        :param int, optional concurrency: How many monitors are edited at the same time, defaults to 10
+        :return: The server response by monitor id, see :meth:`~.UptimeKumaApi.edit_monitor`.
+            If a monitor could not be edited, the exception is returned instead of the response.
+        :rtype: dict
+        :raises UptimeKumaException: If a monitor does not exist.
+        :raises TypeError: If an argument of a monitor is missing.
+        :raises ValueError: If an argument of a monitor is invalid.
+        :raises Timeout: If the monitor list with the edited monitors is not received.
+        """
+        monitors_data = {id_: await self._build_monitor_edit_data(id_, kwargs) for id_, kwargs in monitors.items()}
+        changed = [data for data in monitors_data.values() if data is not None]
+
+        results = await _gather_concurrently(self._edit_monitor, changed, concurrency)
+        r = _merge_monitor_edit_results(monitors_data, results)
+        # wait for the monitor list that contains all edits, like add_monitors
+        await self._wait_for_monitor_edits([i for i, j in r.items() if not isinstance(j, Exception)])
+        return r
+
+    async def _edit_monitor(self, data: dict) -> dict:
+        count = self._monitor_edit_started()
+        r = await self._call('editMonitor', data)
+        self._monitor_edit_done(data["id"], count)
+        return r
+
+    async def _wait_for_monitor_edits(self, ids) -> None:
+        await self._wait_for(
+            lambda: self._monitor_edits_received(ids),
+            f"Timed out while waiting for event {Event.MONITOR_LIST}"
+        )
+
+    async def _build_monitor_edit_data(self, id_: int, kwargs: dict) -> dict | None:
+        # the cached monitor list must contain the previous edits of the monitor
+        await self._wait_for_monitor_edits([id_])
+        # the monitor list contains the same monitor data as getMonitor
+        monitor = await self._get_event_entity(Event.MONITOR_LIST, id_, convert=_convert_monitor_list_return)
+        if monitor is None:
+            monitor = await self.get_monitor(id_)
+        return _merge_monitor_edit_data(monitor, kwargs)
+
+    # monitor tags
+
+    async def add_monitor_tag(self, tag_id: int, monitor_id: int, value: str = "") -> dict:
+        """
+        Add a tag to a monitor. See :meth:`.UptimeKumaApi.add_monitor_tag`.
+
+        :param int tag_id: Id of the tag.
+        :param int monitor_id: Id of the monitor to add the tag to.
+        :param str, optional value: Value of the tag., defaults to ""
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._call('addMonitorTag', (tag_id, monitor_id, value))
+        # the monitor list event does not send the updated tags
+        self._store_monitor((await self._call('getMonitor', monitor_id))["monitor"])
+        return r
+
+    async def delete_monitor_tag(self, tag_id: int, monitor_id: int, value: str = "") -> dict:
+        """
+        Delete a tag from a monitor. See :meth:`.UptimeKumaApi.delete_monitor_tag`.
+
+        :param int tag_id: Id of the tag to remove.
+        :param int monitor_id: Id of monitor to remove the tag from.
+        :param str, optional value: Value of the tag., defaults to ""
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the monitor tag does not exist or the server returns an error.
+        """
+        await self._wait_for_event_data(Event.MONITOR_LIST)
+        if not self._monitor_tag_exists(tag_id, monitor_id, value):
+            raise UptimeKumaException("monitor tag does not exist")
+        r = await self._call('deleteMonitorTag', (tag_id, monitor_id, value))
+        # the monitor list event does not send the updated tags
+        self._remove_monitor_tag(tag_id, monitor_id, value)
+        return r
+
+    async def get_monitors_by_tag(self, tag_id: int, value: str = None) -> list[dict]:
+        """
+        Get all monitors with a tag. See :meth:`.UptimeKumaApi.get_monitors_by_tag`.
+
+        :param int tag_id: Id of the tag.
+        :param str, optional value: Only return monitors with this tag value, defaults to None (all values)
+        :return: The monitors with the tag.
+        :rtype: list
+        """
+        await self._wait_for_event_data(Event.MONITOR_LIST)
+        return self._read_monitors_by_tag(tag_id, value)
+
+    # notification
+
+    @append_docstring(copy_docstring)
+    async def get_notifications(self, copy: bool = True) -> list[dict]:
+        """
+        Get all notifications. See :meth:`.UptimeKumaApi.get_notifications`.
+
+        :return: All notifications.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.NOTIFICATION_LIST, _convert_notification_list_return, copy)
+
+    async def get_notification(self, id_: int) -> dict:
+        """
+        Get a notification. See :meth:`.UptimeKumaApi.get_notification`.
+
+        :param int id_: Id of the notification to get.
+        :return: The notification.
+        :rtype: dict
+        :raises UptimeKumaException: If the notification does not exist.
+        """
+        notification = await self._get_event_entity(Event.NOTIFICATION_LIST, id_, convert=_convert_notification_list_return)
+        if notification is None:
+            raise UptimeKumaException("notification does not exist")
+        return notification
+
+    async def test_notification(self, **kwargs) -> dict:
+        """
+        Test a notification. See :meth:`.UptimeKumaApi.test_notification` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_notification_data(**kwargs)
+        _check_arguments_notification(data)
+        return await self._call('testNotification', data)
+
+    async def add_notification(self, **kwargs) -> dict:
+        """
+        Add a notification. See :meth:`.UptimeKumaApi.add_notification` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_notification_data(**kwargs)
+        _check_arguments_notification(data)
+        async with self.wait_for_event(Event.NOTIFICATION_LIST):
+            return await self._call('addNotification', (data, None))
+
+    async def edit_notification(self, id_: int, **kwargs) -> dict:
+        """
+        Edit a notification. See :meth:`.UptimeKumaApi.edit_notification` for the arguments.
+
+        :param int id_: Id of the notification to edit.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        notification = _merge_notification_edit_data(await self.get_notification(id_), kwargs)
+        async with self.wait_for_event(Event.NOTIFICATION_LIST):
+            return await self._call('addNotification', (notification, id_))
+
+    async def delete_notification(self, id_: int) -> dict:
+        """
+        Delete a notification. See :meth:`.UptimeKumaApi.delete_notification`.
+
+        :param int id_: Id of the notification to delete.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the notification does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.NOTIFICATION_LIST):
+            if not await self._event_entity_exists(Event.NOTIFICATION_LIST, id_):
+                raise UptimeKumaException("notification does not exist")
+            return await self._call('deleteNotification', id_)
+
+    async def check_apprise(self) -> bool:
+        """
+        Check if apprise exists. See :meth:`.UptimeKumaApi.check_apprise`.
+
+        :return: The server response.
+        :rtype: bool
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('checkApprise')
+
+    # proxy
+
+    @append_docstring(copy_docstring)
+    async def get_proxies(self, copy: bool = True) -> list[dict]:
+        """
+        Get all proxies. See :meth:`.UptimeKumaApi.get_proxies`.
+
+        :return: All proxies.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.PROXY_LIST, _convert_proxy_list_return, copy)
+
+    async def get_proxy(self, id_: int) -> dict:
+        """
+        Get a proxy. See :meth:`.UptimeKumaApi.get_proxy`.
+
+        :param int id_: The proxy id.
+        :return: The proxy.
+        :rtype: dict
+        :raises UptimeKumaException: If the proxy does not exist.
+        """
+        proxy = await self._get_event_entity(Event.PROXY_LIST, id_, convert=_convert_proxy_list_return)
+        if proxy is None:
+            raise UptimeKumaException("proxy does not exist")
+        return proxy
+
+    async def add_proxy(self, **kwargs) -> dict:
+        """
+        Add a proxy. See :meth:`.UptimeKumaApi.add_proxy` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_proxy_data(**kwargs)
+        _check_arguments_proxy(data)
+        async with self.wait_for_event(Event.PROXY_LIST):
+            return await self._call('addProxy', (data, None))
+
+    async def edit_proxy(self, id_: int, **kwargs) -> dict:
+        """
+        Edit a proxy. See :meth:`.UptimeKumaApi.edit_proxy` for the arguments.
+
+        :param int id_: The proxy id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        proxy = await self.get_proxy(id_)
+        proxy.update(kwargs)
+        _check_arguments_proxy(proxy)
+        async with self.wait_for_event(Event.PROXY_LIST):
+            return await self._call('addProxy', (proxy, id_))
+
+    async def delete_proxy(self, id_: int) -> dict:
+        """
+        Delete a proxy. See :meth:`.UptimeKumaApi.delete_proxy`.
+
+        :param int id_: The proxy id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the proxy does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.PROXY_LIST):
+            if not await self._event_entity_exists(Event.PROXY_LIST, id_):
+                raise UptimeKumaException("proxy does not exist")
+            return await self._call('deleteProxy', id_)
+
+    # status page
+
+    @append_docstring(copy_docstring)
+    async def get_status_pages(self, copy: bool = True) -> list[dict]:
+        """
+        Get all status pages. See :meth:`.UptimeKumaApi.get_status_pages`.
+
+        :return: All status pages.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.STATUS_PAGE_LIST, _convert_status_page_list_return, copy)
+
+    async def get_status_page(self, slug: str) -> dict:
+        """
+        Get a status page. See :meth:`.UptimeKumaApi.get_status_page`.
+
+        :param str slug: The slug of the status page.
+        :return: The status page.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        # the socket request and the http request run concurrently
+        r1, (_, r2) = await asyncio.gather(
+            self._call('getStatusPage', slug),
+            self._http_get_json(f"/api/status-page/{slug}")
+        )
+        return _convert_status_page_return(r1["config"], r2)
+
+    async def get_status_page_heartbeats(self, slug: str) -> dict:
+        """
+        Get the heartbeats and uptimes of the monitors of a status page.
+        See :meth:`.UptimeKumaApi.get_status_page_heartbeats`.
+
+        :param str slug: The slug of the status page.
+        :return: The heartbeats and the 24 hour uptime by monitor id.
+        :rtype: dict
+        :raises UptimeKumaException: If the status page does not exist.
+        """
+        r, data = await self._http_get_json(f"/api/status-page/heartbeat/{slug}")
+        if r.status_code == 404:
+            raise UptimeKumaException("status page does not exist")
+        return _convert_status_page_heartbeats_return(data)
+
+    async def add_status_page(self, slug: str, title: str) -> dict:
+        """
+        Add a status page. See :meth:`.UptimeKumaApi.add_status_page`.
+
+        :param str slug: Slug
+        :param str title: Title
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        async with self.wait_for_event(Event.STATUS_PAGE_LIST):
+            return await self._call('addStatusPage', (title, slug))
+
+    async def delete_status_page(self, slug: str) -> dict:
+        """
+        Delete a status page. See :meth:`.UptimeKumaApi.delete_status_page`.
+
+        :param str slug: Slug
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the status page does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.STATUS_PAGE_LIST):
+            if not await self._event_entity_exists(Event.STATUS_PAGE_LIST, slug, key="slug"):
+                raise UptimeKumaException("status page does not exist")
+            r = await self._call('deleteStatusPage', slug)
+            self._invalidate_status_page(slug)
+            self._remove_status_page(slug)
+            return r
+
+    async def save_status_page(self, slug: str, **kwargs) -> dict:
+        """
+        Save a status page. See :meth:`.UptimeKumaApi.save_status_page` for the arguments.
+
+        :param str slug: Slug
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        # the cached public data must not overwrite the changes of other clients
+        self._invalidate_status_page(slug)
+        status_page = await self.get_status_page(slug)
+        await self._wait_for_capabilities()
+        data = self._build_status_page_save_data(status_page, kwargs)
+        r = await self._call('saveStatusPage', data)
+        self._invalidate_status_page(slug)
+        self._store_status_page((await self._call('getStatusPage', slug))["config"])
+        return r
+
+    async def post_incident(
+            self,
+            slug: str,
+            title: str,
+            content: str,
+            style: IncidentStyle = IncidentStyle.PRIMARY
+    ) -> dict:
+        """
+        Post an incident to a status page. See :meth:`.UptimeKumaApi.post_incident`.
+
+        :param str slug: Slug
+        :param str title: Title
+        :param str content: Content
+        :param IncidentStyle, optional style: Style, defaults to :attr:`~.IncidentStyle.PRIMARY`
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        incident = {
+            "title": title,
+            "content": content,
+            "style": style
+        }
+        r = (await self._call('postIncident', (slug, incident)))["incident"]
+        await self.save_status_page(slug)
+        parse_incident_style(r)
+        return r
+
+    async def unpin_incident(self, slug: str) -> dict:
+        """
+        Unpin an incident from a status page. See :meth:`.UptimeKumaApi.unpin_incident`.
+
+        :param str slug: Slug
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._call('unpinIncident', slug)
+        await self.save_status_page(slug)
+        return r
+
+    # badge
+
+    async def get_badge(
+            self,
+            monitor_id: int,
+            type: BadgeType = BadgeType.STATUS,
+            duration: int = None,
+            **kwargs
+    ) -> str:
+        """
+        Get the SVG badge of a monitor. See :meth:`.UptimeKumaApi.get_badge`.
+
+        :param int monitor_id: Id of the monitor.
+        :param BadgeType, optional type: Type of the badge, defaults to :attr:`~.BadgeType.STATUS`
+        :param int, optional duration: Duration in hours, defaults to None (the default of the server)
+        :param kwargs: Query parameters of the badge, e.g. ``label``, ``upLabel``, ``color`` or ``style``.
+        :return: The badge.
+        :rtype: str
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._http_get(_badge_path(monitor_id, type, duration), kwargs)
+        return _convert_badge_return(r)
+
+    # heartbeat
+
+    @append_docstring(copy_docstring)
+    async def get_heartbeats(self, copy: bool = True) -> dict:
+        """
+        Get heartbeats. See :meth:`.UptimeKumaApi.get_heartbeats`.
+
+        :return: The heartbeats by monitor id.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.HEARTBEAT_LIST, _convert_heartbeat_list_return, copy)
+
+    async def get_heartbeat_columns(self) -> dict[int, HeartbeatColumns]:
+        """
+        Get the heartbeats as columns. See :meth:`.UptimeKumaApi.get_heartbeat_columns`.
+
+        :return: The heartbeat columns by monitor id.
+        :rtype: dict
+        :raises UptimeKumaException: If columnar heartbeats are not enabled.
+        """
+        if not self.columnar_heartbeats:
+            raise UptimeKumaException("columnar heartbeats are not enabled")
+        if not await self._wait_for_event_data(Event.HEARTBEAT_LIST):
+            return {}
+        with self._event_lock:
+            return {i: j.snapshot() for i, j in self._event_data[Event.HEARTBEAT_LIST].items()}
+
+    @append_docstring(copy_docstring)
+    async def get_important_heartbeats(self, copy: bool = True) -> dict:
+        """
+        Get important heartbeats. See :meth:`.UptimeKumaApi.get_important_heartbeats`.
+
+        :return: The important heartbeats by monitor id.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.IMPORTANT_HEARTBEAT_LIST, _convert_heartbeat_list_return, copy)
+
+    # avg ping
+
+    @append_docstring(copy_docstring)
+    async def avg_ping(self, copy: bool = True) -> dict:
+        """
+        Get average ping. See :meth:`.UptimeKumaApi.avg_ping`.
+
+        :return: The average ping by monitor id.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.AVG_PING, copy=copy)
+
+    # cert info
+
+    @append_docstring(copy_docstring)
+    async def cert_info(self, copy: bool = True) -> dict:
+        """
+        Get certificate info. See :meth:`.UptimeKumaApi.cert_info`.
+
+        :return: The certificate info by monitor id.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.CERT_INFO, copy=copy)
+
+    # uptime
+
+    @append_docstring(copy_docstring)
+    async def uptime(self, copy: bool = True) -> dict:
+        """
+        Get monitor uptime. See :meth:`.UptimeKumaApi.uptime`.
+
+        :return: The uptime by monitor id.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.UPTIME, copy=copy)
+
+    # info
+
+    @append_docstring(copy_docstring)
+    async def info(self, copy: bool = True) -> dict:
+        """
+        Get server info. See :meth:`.UptimeKumaApi.info`.
+
+        :return: The server info.
+        :rtype: dict
+        """
+        return await self._get_event_data(Event.INFO, copy=copy)
+
+    # clear
+
+    async def clear_events(self, monitor_id: int) -> dict:
+        """
+        Clear monitor events. See :meth:`.UptimeKumaApi.clear_events`.
+
+        :param int monitor_id: The monitor id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('clearEvents', monitor_id)
+
+    async def clear_heartbeats(self, monitor_id: int) -> dict:
+        """
+        Clear monitor heartbeats. See :meth:`.UptimeKumaApi.clear_heartbeats`.
+
+        :param int monitor_id: The monitor id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('clearHeartbeats', monitor_id)
+
+    async def clear_statistics(self) -> dict:
+        """
+        Clear statistics. See :meth:`.UptimeKumaApi.clear_statistics`.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('clearStatistics')
+
+    # tags
+
+    async def get_tags(self) -> list[dict]:
+        """
+        Get all tags. See :meth:`.UptimeKumaApi.get_tags`.
+
+        :return: All tags.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return (await self._call('getTags'))["tags"]
+
+    async def get_tag(self, id_: int) -> dict:
+        """
+        Get a tag. See :meth:`.UptimeKumaApi.get_tag`.
+
+        :param int id_: The id of the tag to get.
+        :return: The tag.
+        :rtype: dict
+        :raises UptimeKumaException: If the tag does not exist.
+        """
+        for tag in await self.get_tags():
+            if tag["id"] == id_:
+                return tag
+        raise UptimeKumaException("tag does not exist")
+
+    async def add_tag(self, **kwargs) -> dict:
+        """
+        Add a tag. See :meth:`.UptimeKumaApi.add_tag` for the arguments.
+
+        :return: The added tag.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_tag_data(**kwargs)
+        _check_arguments_tag(data)
+        return (await self._call('addTag', data))["tag"]
+
+    async def edit_tag(self, id_: int, **kwargs) -> dict:
+        """
+        Edits an existing tag. See :meth:`.UptimeKumaApi.edit_tag` for the arguments.
+
+        :param int id_: Id of the tag to edit.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = await self.get_tag(id_)
+        data.update(kwargs)
+        _check_arguments_tag(data)
+        return await self._call('editTag', data)
+
+    async def delete_tag(self, id_: int) -> dict:
+        """
+        Delete a tag. See :meth:`.UptimeKumaApi.delete_tag`.
+
+        :param int id_: Id of the tag to delete.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the tag does not exist or the server returns an error.
+        """
+        if id_ not in [i["id"] for i in await self.get_tags()]:
+            raise UptimeKumaException("tag does not exist")
+        return await self._call('deleteTag', id_)
+
+    # settings
+
+    async def get_settings(self) -> dict:
+        """
+        Get settings. See :meth:`.UptimeKumaApi.get_settings`.
+
+        :return: Settings.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return (await self._call('getSettings'))["data"]
+
+    async def set_settings(
+            self,
+            password: str = None,  # only required if disableAuth is true
+
+            # about
+            checkUpdate: bool = True,
+            checkBeta: bool = False,
+
+            # monitor history
+            keepDataPeriodDays: int = 180,
+
+            # general
+            serverTimezone: str = "",
+            entryPage: str = "dashboard",
+            searchEngineIndex: bool = False,
+            primaryBaseURL: str = "",
+            steamAPIKey: str = "",
+            nscd: bool = False,
+            dnsCache: bool = False,
+            chromeExecutable: str = "",
+
+            # notifications
+            tlsExpiryNotifyDays: list = None,
+
+            # security
+            disableAuth: bool = False,
+
+            # reverse proxy
+            trustProxy: bool = False
+    ) -> dict:
+        """
+        Set settings. See :meth:`.UptimeKumaApi.set_settings` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        await self._wait_for_capabilities()
+        data = self._build_settings_data(
+            checkUpdate=checkUpdate,
+            checkBeta=checkBeta,
+            keepDataPeriodDays=keepDataPeriodDays,
+            serverTimezone=serverTimezone,
+            entryPage=entryPage,
+            searchEngineIndex=searchEngineIndex,
+            primaryBaseURL=primaryBaseURL,
+            steamAPIKey=steamAPIKey,
+            nscd=nscd,
+            dnsCache=dnsCache,
+            chromeExecutable=chromeExecutable,
+            tlsExpiryNotifyDays=tlsExpiryNotifyDays,
+            disableAuth=disableAuth,
+            trustProxy=trustProxy
+        )
+        return await self._call('setSettings', (data, password))
+
+    async def change_password(self, old_password: str, new_password: str) -> dict:
+        """
+        Change password. See :meth:`.UptimeKumaApi.change_password`.
+
+        :param str old_password: Old password
+        :param str new_password: New password
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('changePassword', {
+            "currentPassword": old_password,
+            "newPassword": new_password,
+        })
+
+    async def upload_backup(self, json_data: str, import_handle: str = "skip") -> dict:
+        """
+        Import a backup. See :meth:`.UptimeKumaApi.upload_backup`.
+
+        :param str json_data: Backup data as json string.
+        :param str, optional import_handle: "skip", "overwrite" or "keep", defaults to "skip"
+        :return: The server response.
+        :rtype: dict
+        :raises ValueError: If the import handle is unknown.
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        if import_handle not in ["overwrite", "skip", "keep"]:
+            raise ValueError(f"Unknown import_handle value: {import_handle}")
+        return await self._call('uploadBackup', (json_data, import_handle))
+
+    # 2FA
+
+    async def twofa_status(self) -> dict:
+        """
+        Get the current 2FA status. See :meth:`.UptimeKumaApi.twofa_status`.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('twoFAStatus')
+
+    async def prepare_2fa(self, password: str) -> dict:
+        """
+        Prepare 2FA configuration. See :meth:`.UptimeKumaApi.prepare_2fa`.
+
+        :param str password: Current password.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('prepare2FA', password)
+
+    async def verify_token(self, token: str, password: str) -> dict:
+        """
+        Verify the 2FA token. See :meth:`.UptimeKumaApi.verify_token`.
+
+        :param str token: 2FA token.
+        :param str password: Current password.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('verifyToken', (token, password))
+
+    async def save_2fa(self, password: str) -> dict:
+        """
+        Save the current 2FA configuration. See :meth:`.UptimeKumaApi.save_2fa`.
+
+        :param str password: Current password.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('save2FA', password)
+
+    async def disable_2fa(self, password: str) -> dict:
+        """
+        Disable 2FA for this user. See :meth:`.UptimeKumaApi.disable_2fa`.
+
+        :param str password: Current password.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('disable2FA', password)
+
+    # login
+
+    async def login(self, username: str = None, password: str = None, token: str = "") -> dict:
+        """
+        Login. See :meth:`.UptimeKumaApi.login`.
+
+        :param str, optional username: Username. Must be None if disableAuth is enabled., defaults to None
+        :param str, optional password: Password. Must be None if disableAuth is enabled., defaults to None
+        :param str, optional token: 2FA Token. Required if 2FA is enabled., defaults to ""
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        # autologin
+        if username is None and password is None:
+            await self._wait_for_event(Event.AUTO_LOGIN)
+            return {}
+
+        r = await self._call('login', {
+            "username": username,
+            "password": password,
+            "token": token
+        })
+        # replayed after a reconnect
+        self._token = r.get("token")
+        return r
+
+    async def login_by_token(self, token: str) -> dict:
+        """
+        Login by token. See :meth:`.UptimeKumaApi.login_by_token`.
+
+        :param str token: Login token generated by :meth:`~login`
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._call('loginByToken', token)
+        self._token = token
+        return r
+
+    async def logout(self) -> None:
+        """
+        Logout.
+
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = await self._call('logout')
+        self._token = None
+        return r
+
+    # setup
+
+    async def need_setup(self) -> bool:
+        """
+        Check if the server has already been set up. See :meth:`.UptimeKumaApi.need_setup`.
+
+        :return: The server response.
+        :rtype: bool
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('needSetup')
+
+    async def setup(self, username: str, password: str) -> dict:
+        """
+        Set up the server. See :meth:`.UptimeKumaApi.setup`.
+
+        :param str username: Username
+        :param str password: Password
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call("setup", (username, password))
+
+    # database
+
+    async def get_database_size(self) -> dict:
+        """
+        Get database size. See :meth:`.UptimeKumaApi.get_database_size`.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('getDatabaseSize')
+
+    async def shrink_database(self) -> dict:
+        """
+        Shrink database. See :meth:`.UptimeKumaApi.shrink_database`.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('shrinkDatabase')
+
+    # docker host
+
+    @append_docstring(copy_docstring)
+    async def get_docker_hosts(self, copy: bool = True) -> list[dict]:
+        """
+        Get all docker hosts. See :meth:`.UptimeKumaApi.get_docker_hosts`.
+
+        :return: All docker hosts.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.DOCKER_HOST_LIST, _convert_docker_host_list_return, copy)
+
+    async def get_docker_host(self, id_: int) -> dict:
+        """
+        Get a docker host. See :meth:`.UptimeKumaApi.get_docker_host`.
+
+        :param int id_: The docker host id.
+        :return: The docker host.
+        :rtype: dict
+        :raises UptimeKumaException: If the docker host does not exist.
+        """
+        docker_host = await self._get_event_entity(Event.DOCKER_HOST_LIST, id_, convert=_convert_docker_host_list_return)
+        if docker_host is None:
+            raise UptimeKumaException("docker host does not exist")
+        return docker_host
+
+    async def test_docker_host(self, **kwargs) -> dict:
+        """
+        Test a docker host. See :meth:`.UptimeKumaApi.test_docker_host` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_docker_host_data(**kwargs)
+        return await self._call('testDockerHost', data)
+
+    async def add_docker_host(self, **kwargs) -> dict:
+        """
+        Add a docker host. See :meth:`.UptimeKumaApi.add_docker_host` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = _build_docker_host_data(**kwargs)
+        _convert_docker_host_input(data)
+        async with self.wait_for_event(Event.DOCKER_HOST_LIST):
+            return await self._call('addDockerHost', (data, None))
+
+    async def edit_docker_host(self, id_: int, **kwargs) -> dict:
+        """
+        Edit a docker host. See :meth:`.UptimeKumaApi.edit_docker_host` for the arguments.
+
+        :param int id_: The docker host id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = await self.get_docker_host(id_)
+        data.update(kwargs)
+        _convert_docker_host_input(data)
+        async with self.wait_for_event(Event.DOCKER_HOST_LIST):
+            return await self._call('addDockerHost', (data, id_))
+
+    async def delete_docker_host(self, id_: int) -> dict:
+        """
+        Delete a docker host. See :meth:`.UptimeKumaApi.delete_docker_host`.
+
+        :param int id_: The docker host id.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the docker host does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.DOCKER_HOST_LIST):
+            if not await self._event_entity_exists(Event.DOCKER_HOST_LIST, id_):
+                raise UptimeKumaException("docker host does not exist")
+            return await self._call('deleteDockerHost', id_)
+
+    # maintenance
+
+    @append_docstring(copy_docstring)
+    async def get_maintenances(self, copy: bool = True) -> list[dict]:
+        """
+        Get all maintenances. See :meth:`.UptimeKumaApi.get_maintenances`.
+
+        :return: All maintenances.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.MAINTENANCE_LIST, _convert_maintenance_list_return, copy)
+
+    async def get_maintenance(self, id_: int) -> dict:
+        """
+        Get a maintenance. See :meth:`.UptimeKumaApi.get_maintenance`.
+
+        :param int id_: Id of the maintenance to get.
+        :return: The maintenance.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        r = (await self._call('getMaintenance', id_))["maintenance"]
+        parse_maintenance_strategy(r)
+        return r
+
+    async def add_maintenance(self, **kwargs) -> dict:
+        """
+        Adds a maintenance. See :meth:`.UptimeKumaApi.add_maintenance` for the arguments.
+
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = self._build_maintenance_data(**kwargs)
+        _check_arguments_maintenance(data)
+        return await self._call('addMaintenance', data)
+
+    async def edit_maintenance(self, id_: int, **kwargs) -> dict:
+        """
+        Edits a maintenance. See :meth:`.UptimeKumaApi.edit_maintenance` for the arguments.
+
+        :param int id_: Id of the maintenance to edit.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        maintenance = await self.get_maintenance(id_)
+        maintenance.update(kwargs)
+        _check_arguments_maintenance(maintenance)
+        return await self._call('editMaintenance', maintenance)
+
+    async def delete_maintenance(self, id_: int) -> dict:
+        """
+        Deletes a maintenance. See :meth:`.UptimeKumaApi.delete_maintenance`.
+
+        :param int id_: Id of the maintenance to delete.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the maintenance does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.MAINTENANCE_LIST):
+            if not await self._event_entity_exists(Event.MAINTENANCE_LIST, id_):
+                raise UptimeKumaException("maintenance does not exist")
+            return await self._call('deleteMaintenance', id_)
+
+    async def pause_maintenance(self, id_: int) -> dict:
+        """
+        Pauses a maintenance. See :meth:`.UptimeKumaApi.pause_maintenance`.
+
+        :param int id_: Id of the maintenance to pause.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('pauseMaintenance', id_)
+
+    async def resume_maintenance(self, id_: int) -> dict:
+        """
+        Resumes a maintenance. See :meth:`.UptimeKumaApi.resume_maintenance`.
+
+        :param int id_: Id of the maintenance to resume.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('resumeMaintenance', id_)
+
+    async def get_monitor_maintenance(self, id_: int) -> list[dict]:
+        """
+        Gets all monitors of a maintenance. See :meth:`.UptimeKumaApi.get_monitor_maintenance`.
+
+        :param int id_: Id of the maintenance to get the monitors from.
+        :return: All monitors of the maintenance.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return (await self._call('getMonitorMaintenance', id_))["monitors"]
+
+    async def add_monitor_maintenance(
+            self,
+            id_: int,
+            monitors: list,
+    ) -> dict:
+        """
+        Adds monitors to a maintenance. See :meth:`.UptimeKumaApi.add_monitor_maintenance`.
+
+        :param int id_: Id of the maintenance to add the monitors to.
+        :param list monitors: The list of monitors to add to the maintenance.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('addMonitorMaintenance', (id_, monitors))
+
+    async def get_status_page_maintenance(self, id_: int) -> list[dict]:
+        """
+        Gets all status pages of a maintenance. See :meth:`.UptimeKumaApi.get_status_page_maintenance`.
+
+        :param int id_: Id of the maintenance to get the status pages from.
+        :return: All status pages of the maintenance.
+        :rtype: list
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return (await self._call('getMaintenanceStatusPage', id_))["statusPages"]
+
+    async def add_status_page_maintenance(
+            self,
+            id_: int,
+            status_pages: list,
+    ) -> dict:
+        """
+        Adds status pages to a maintenance. See :meth:`.UptimeKumaApi.add_status_page_maintenance`.
+
+        :param int id_: Id of the maintenance to add the status pages to.
+        :param list status_pages: The list of status pages to add to the maintenance.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        return await self._call('addMaintenanceStatusPage', (id_, status_pages))
+
+    # api key
+
+    @append_docstring(copy_docstring)
+    async def get_api_keys(self, copy: bool = True) -> list[dict]:
+        """
+        Get all api keys. See :meth:`.UptimeKumaApi.get_api_keys`.
+
+        :return: All api keys.
+        :rtype: list
+        """
+        return await self._get_event_data(Event.API_KEY_LIST, _convert_api_key_list_return, copy)
+
+    async def get_api_key(self, id_: int) -> dict:
+        """
+        Get an api key. See :meth:`.UptimeKumaApi.get_api_key`.
+
+        :param int id_: The api key id.
+        :return: The api key.
+        :rtype: dict
+        :raises UptimeKumaException: If the api key does not exist.
+        """
+        api_key = await self._get_event_entity(Event.API_KEY_LIST, id_, convert=_convert_api_key_list_return)
+        if api_key is None:
+            raise UptimeKumaException("api key does not exist")
+        return api_key
+
+    async def add_api_key(self, name: str, expires: str, active: bool) -> dict:
+        """
+        Adds an api key. See :meth:`.UptimeKumaApi.add_api_key`.
+
+        :param str name: Name of the api key.
+        :param str expires: Expiration date of the api key. Set to ``None`` to disable expiration.
+        :param bool active: True to activate api key.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        data = {
+            "name": name,
+            "expires": expires,
+            "active": 1 if active else 0
+        }
+        async with self.wait_for_event(Event.API_KEY_LIST):
+            return await self._call('addAPIKey', data)
+
+    async def enable_api_key(self, id_: int) -> dict:
+        """
+        Enable an api key. See :meth:`.UptimeKumaApi.enable_api_key`.
+
+        :param int id_: Id of the api key to enable.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        async with self.wait_for_event(Event.API_KEY_LIST):
+            return await self._call('enableAPIKey', id_)
+
+    async def disable_api_key(self, id_: int) -> dict:
+        """
+        Disable an api key. See :meth:`.UptimeKumaApi.disable_api_key`.
+
+        :param int id_: Id of the api key to disable.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the server returns an error.
+        """
+        async with self.wait_for_event(Event.API_KEY_LIST):
+            return await self._call('disableAPIKey', id_)
+
+    async def delete_api_key(self, id_: int) -> dict:
+        """
+        Delete an api key. See :meth:`.UptimeKumaApi.delete_api_key`.
+
+        :param int id_: Id of the api key to delete.
+        :return: The server response.
+        :rtype: dict
+        :raises UptimeKumaException: If the api key does not exist or the server returns an error.
+        """
+        async with self.wait_for_event(Event.API_KEY_LIST):
+            if not await self._event_entity_exists(Event.API_KEY_LIST, id_):
+                raise UptimeKumaException("api key does not exist")
+            return await self._call('deleteAPIKey', id_)
+
+    # helper methods
+
+    async def get_monitor_status(self, monitor_id: int) -> MonitorStatus:
+        """
+        Get the monitor status. See :meth:`.UptimeKumaApi.get_monitor_status`.
+
+        :param int monitor_id: Id of the monitor.
+        :return: The monitor status.
+        :rtype: MonitorStatus
+        :raises UptimeKumaException: If the monitor does not exist.
+        """
+        heartbeats = await self.get_heartbeats(copy=False)
+        if monitor_id not in heartbeats:
+            raise UptimeKumaException("monitor does not exist")
+        return MonitorStatus(heartbeats[monitor_id][-1]["status"])
@@ -0,0 +1,23 @@
+from enum import Enum
+
+
+class BadgeType(str, Enum):
+    """Enumerate badge types."""
+
+    STATUS = "status"
+    """Status"""
+
+    UPTIME = "uptime"
+    """Uptime"""
+
+    PING = "ping"
+    """Ping"""
+
+    AVG_RESPONSE = "avg-response"
+    """Average response time"""
+
+    CERT_EXP = "cert-exp"
+    """Certificate expiry"""
+
+    RESPONSE = "response"
+    """Response time"""
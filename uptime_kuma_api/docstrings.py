@@ -385,3 +385,6 @@ def tag_docstring(mode) -> str:
         :param str{", optional" if mode == "edit" else ""} name: Tag name
         :param str{", optional" if mode == "edit" else ""} color: Tag color
     """
+
+
+copy_docstring = ":param bool, optional copy: ``False`` to return a read-only snapshot of the cached data without copying it. The snapshot is shared by all calls until the data changes and must not be modified, defaults to True"
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Iterable
+
+from . import Timeout, UptimeKumaException
+from .api import UptimeKumaApi
+
+logger = logging.getLogger(__name__)
+
+
+class UptimeKumaFleet(object):
+    """Holds authenticated connections to multiple Uptime Kuma instances and calls them concurrently.
+
+    Each instance is configured with the arguments of :class:`UptimeKumaApi` and the credentials for
+    :meth:`~.UptimeKumaApi.login` (``username`` and ``password``) or :meth:`~.UptimeKumaApi.login_by_token`
+    (``token``). The connections are established concurrently. Instances that cannot be connected are
+    listed in :attr:`connect_errors` and are skipped by all calls.
+
+    Example::
+
+        >>> from uptime_kuma_api import UptimeKumaFleet
+        >>> with UptimeKumaFleet({
+        ...     "eu": {"url": "https://eu.example.com", "username": "admin", "password": "secret"},
+        ...     "us": {"url": "https://us.example.com", "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."}
+        ... }) as fleet:
+        ...     fleet.call("get_monitor_beats", 1, 6)
+        ...     fleet.get_monitors()
+        {
+            'eu': [...],
+            'us': UptimeKumaException('...')
+        }
+        [
+            {
+                'id': 1,
+                'instance': 'eu',
+                'name': 'monitor 1',
+                ...
+            },
+            ...
+        ]
+
+    :param dict instances: The configuration of each instance by instance name.
+    :param int, optional max_workers: How many calls run at the same time, defaults to None (one per instance)
+    :param float, optional timeout: How many seconds to wait for each instance to connect and log in, defaults to None (the ``timeout`` of the instances)
+    """
+
+    def __init__(self, instances: dict[str, dict], max_workers: int = None, timeout: float = None) -> None:
+        self.apis: dict[str, UptimeKumaApi] = {}
+        """The connected instances by instance name."""
+
+        self.connect_errors: dict[str, Exception] = {}
+        """The errors of the instances that could not be connected by instance name."""
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or max(len(instances), 1))
+
+        r = self._run(
+            {name: (self._connect, (config,), {}) for name, config in instances.items()},
+            timeout,
+            # connections that are established after the timeout are closed
+            late_result=lambda api: api.disconnect()
+        )
+        for name, api in r.items():
+            if isinstance(api, Exception):
+                logger.warning(f"Unable to connect to instance {name}: {api}")
+                self.connect_errors[name] = api
+            else:
+                self.apis[name] = api
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+
+    def __getitem__(self, name: str) -> UptimeKumaApi:
+        return self.apis[name]
+
+    def __iter__(self):
+        return iter(self.apis)
+
+    def __len__(self) -> int:
+        return len(self.apis)
+
+    @staticmethod
+    def _connect(config: dict) -> UptimeKumaApi:
+        config = dict(config)
+        username = config.pop("username", None)
+        password = config.pop("password", None)
+        token = config.pop("token", None)
+        api = UptimeKumaApi(**config)
+        try:
+            if token:
+                api.login_by_token(token)
+            else:
+                api.login(username, password)
+        except Exception:
+            api.disconnect()
+            raise
+        return api
+
+    def _run(self, calls: dict, timeout: float = None, late_result=None) -> dict[str, Any]:
+        # runs the calls concurrently and returns the result or the exception of each call
+        futures = {name: self._executor.submit(func, *args, **kwargs) for name, (func, args, kwargs) in calls.items()}
+        done, _ = wait(futures.values(), timeout=timeout)
+        r = {}
+        for name, future in futures.items():
+            if future not in done:
+                # the call keeps running in the background, its result is discarded
+                if not future.cancel() and late_result:
+                    future.add_done_callback(lambda f: f.exception() is None and late_result(f.result()))
+                r[name] = Timeout(f"Timed out while waiting for instance {name}")
+            elif future.exception() is not None:
+                r[name] = future.exception()
+            else:
+                r[name] = future.result()
+        return r
+
+    def call(self, method: str, *args, instances: Iterable[str] = None, timeout: float = None, **kwargs) -> dict[str, Any]:
+        """
+        Calls a method of :class:`UptimeKumaApi` on all instances concurrently.
+
+        :param str method: The name of the method, e.g. ``get_monitors``.
+        :param args: The positional arguments of the method.
+        :param list, optional instances: The names of the instances to call, defaults to None (all connected instances)
+        :param float, optional timeout: How many seconds to wait for the instances, defaults to None (no limit)
+        :param kwargs: The keyword arguments of the method.
+        :return: The result of each instance by instance name. If the call failed or timed out,
+            the exception is returned instead of the result.
+        :rtype: dict
+        :raises UptimeKumaException: If an instance is not connected.
+
+        Example::
+
+            >>> fleet.call("pause_monitor", 1, instances=["eu"])
+            {
+                'eu': {
+                    'msg': 'Paused Successfully.'
+                }
+            }
+        """
+        names = list(self.apis) if instances is None else list(instances)
+        for name in names:
+            if name not in self.apis:
+                raise UptimeKumaException(f"instance {name} is not connected")
+        return self._run({name: (getattr(self.apis[name], method), args, kwargs) for name in names}, timeout)
+
+    def merged(self, method: str, *args, instances: Iterable[str] = None, timeout: float = None, **kwargs) -> list[dict]:
+        """
+        Calls a method that returns a list on all instances and merges the lists.
+
+        Each entry gets the key ``instance`` with the name of its instance.
+        Instances that fail or time out are skipped, use :meth:`~call` to handle their errors.
+
+        :param str method: The name of the method, e.g. ``get_notifications``.
+        :param args: The positional arguments of the method.
+        :param list, optional instances: The names of the instances to call, defaults to None (all connected instances)
+        :param float, optional timeout: How many seconds to wait for the instances, defaults to None (no limit)
+        :param kwargs: The keyword arguments of the method.
+        :return: The entries of all instances.
+        :rtype: list
+        """
+        r = []
+        for name, result in self.call(method, *args, instances=instances, timeout=timeout, **kwargs).items():
+            if isinstance(result, Exception):
+                logger.warning(f"{method} failed on instance {name}: {result!r}")
+                continue
+            r.extend({**i, "instance": name} for i in result)
+        return r
+
+    def get_monitors(self, instances: Iterable[str] = None, timeout: float = None) -> list[dict]:
+        """
+        Get the monitors of all instances.
+
+        :param list, optional instances: The names of the instances, defaults to None (all connected instances)
+        :param float, optional timeout: How many seconds to wait for the instances, defaults to None (no limit)
+        :return: The monitors of all instances with the key ``instance``.
+        :rtype: list
+        """
+        return self.merged("get_monitors", instances=instances, timeout=timeout)
+
+    def disconnect(self) -> None:
+        """
+        Disconnects from all instances.
+        """
+        self._run({name: (api.disconnect, (), {}) for name, api in self.apis.items()})
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import queue
+import sqlite3
+import threading
+from typing import Iterable, Iterator
+
+from .heartbeat_columns import _heartbeat_monitor_id, format_heartbeat_time, parse_heartbeat_time
+from .heartbeat_listener import HeartbeatListener
+from .heartbeat_segment import HeartbeatSegment
+from .monitor_status import MonitorStatus
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatArchive(HeartbeatListener):
+    """Stores heartbeats in a local SQLite database.
+
+    The heartbeats are stored per monitor ordered by time, so range queries only read the pages of
+    the requested monitor and time window. The database file is read through a memory map of
+    ``mmap_size`` bytes. Heartbeats that are already archived (same monitor and time) are ignored.
+
+    :meth:`~attach` archives each heartbeat event of a :class:`~.UptimeKumaApi` instance. The event
+    handler only queues the heartbeat, a background thread writes the queued heartbeats in batches.
+    A batch that cannot be written is logged and dropped, the thread continues with the next batch.
+
+    Example::
+
+        >>> from uptime_kuma_api import HeartbeatArchive
+        >>> archive = HeartbeatArchive("heartbeats.db")
+        >>> archive.attach(api)
+        >>> archive.extend(api.get_monitor_beats(1, 24))
+        >>> archive.get_beats(1, "2023-01-01 00:00:00", "2023-01-02 00:00:00")
+        [
+            {
+                'duration': 60,
+                'important': False,
+                'monitorID': 1,
+                'msg': '200 - OK',
+                'ping': 193,
+                'status': <MonitorStatus.UP: 1>,
+                'time': '2023-01-01 00:00:42.878'
+            },
+            ...
+        ]
+        >>> archive.close()
+
+    :param str path: The path of the database file. ``:memory:`` keeps the archive in memory.
+    :param int mmap_size: How many bytes of the database file are memory mapped. Default is 256 MiB.
+    :param int batch_size: How many queued heartbeats are written in one transaction. Default is ``1000``.
+    """
+
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024, batch_size: int = 1000) -> None:
+        super().__init__()
+        self.path = path
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        # the primary key is the time index of each monitor, the rows are stored in its order
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS heartbeat (
+                monitor_id INTEGER NOT NULL,
+                time REAL NOT NULL,
+                status INTEGER NOT NULL,
+                ping REAL,
+                duration INTEGER,
+                important INTEGER,
+                msg TEXT,
+                PRIMARY KEY (monitor_id, time)
+            ) WITHOUT ROWID
+        """)
+        self._db.commit()
+
+        # heartbeats of the event handlers, written by the writer thread
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_queue, daemon=True)
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _row(heartbeat, monitor_id=None) -> tuple:
+        return (
+            _heartbeat_monitor_id(heartbeat, monitor_id),
+            parse_heartbeat_time(heartbeat["time"]),
+            int(heartbeat["status"]),
+            heartbeat.get("ping"),
+            heartbeat.get("duration"),
+            1 if heartbeat.get("important") else 0,
+            heartbeat.get("msg")
+        )
+
+    @staticmethod
+    def _heartbeat(row) -> dict:
+        monitor_id, time_, status, ping, duration, important, msg = row
+        if ping is not None and ping.is_integer():
+            ping = int(ping)
+        return {
+            "monitorID": monitor_id,
+            "status": MonitorStatus(status),
+            "time": format_heartbeat_time(time_),
+            "msg": msg,
+            "ping": ping,
+            "important": bool(important),
+            "duration": duration
+        }
+
+    def _insert(self, rows) -> None:
+        with self._lock:
+            try:
+                self._db.executemany("INSERT OR IGNORE INTO heartbeat VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self._db.commit()
+            except Exception:
+                # the rows of a failed batch must not be committed with the next batch
+                self._db.rollback()
+                raise
+
+    def _write_queue(self) -> None:
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < self.batch_size:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            closed = None in rows
+            try:
+                self._insert([i for i in rows if i is not None])
+            except Exception:
+                logger.exception(f"Unable to archive {len(rows)} heartbeats")
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+            if closed:
+                return
+
+    def append(self, heartbeat: dict) -> None:
+        """
+        Queues a heartbeat to be archived.
+
+        :param dict heartbeat: The heartbeat as sent by Uptime Kuma.
+        """
+        self._queue.put(self._row(heartbeat))
+
+    def extend(self, heartbeats: Iterable[dict], monitor_id: int = None) -> None:
+        """
+        Archives multiple heartbeats, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`.
+
+        :param heartbeats: The heartbeats.
+        :param int, optional monitor_id: The monitor id of heartbeats without monitor id,
+            e.g. of :meth:`~.UptimeKumaApi.get_heartbeats`, defaults to None
+        """
+        self._insert([self._row(i, monitor_id) for i in heartbeats])
+
+    def flush(self) -> None:
+        """
+        Waits until all queued heartbeats are written.
+        """
+        self._queue.join()
+
+    def iter_beats(
+            self,
+            monitor_id: int,
+            start: datetime.datetime | str | float = None,
+            end: datetime.datetime | str | float = None
+    ) -> Iterator[dict]:
+        """
+        Iterates over the archived heartbeats of a monitor in a time window, ordered by time.
+
+        The rows are read in batches while iterating.
+
+        :param int monitor_id: The monitor id.
+        :param start: The start of the window as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the first heartbeat)
+        :param end: The end of the window as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the last heartbeat)
+        :return: The heartbeats.
+        :rtype: Iterator
+        """
+        start = float("-inf") if start is None else parse_heartbeat_time(start)
+        end = float("inf") if end is None else parse_heartbeat_time(end)
+        query = "SELECT * FROM heartbeat WHERE monitor_id = ? AND time >= ? AND time <= ? ORDER BY time LIMIT ?"
+        while True:
+            with self._lock:
+                rows = self._db.execute(query, (monitor_id, start, end, self.batch_size)).fetchall()
+            for row in rows:
+                yield self._heartbeat(row)
+            if len(rows) < self.batch_size:
+                return
+            # continue after the last row, the times of a monitor are unique
+            start = rows[-1][1]
+            query = query.replace("time >= ?", "time > ?")
+
+    def get_beats(
+            self,
+            monitor_id: int,
+            start: datetime.datetime | str | float = None,
+            end: datetime.datetime | str | float = None
+    ) -> list[dict]:
+        """
+        Returns the archived heartbeats of a monitor in a time window, ordered by time.
+
+        See :meth:`~iter_beats`.
+
+        :param int monitor_id: The monitor id.
+        :param start: The start of the window, defaults to None (the first heartbeat)
+        :param end: The end of the window, defaults to None (the last heartbeat)
+        :return: The heartbeats.
+        :rtype: list
+        """
+        return list(self.iter_beats(monitor_id, start, end))
+
+    def export(
+            self,
+            monitor_id: int,
+            start: datetime.datetime | str | float = None,
+            end: datetime.datetime | str | float = None
+    ) -> HeartbeatSegment:
+        """
+        Encodes the archived heartbeats of a monitor in a time window as compact segment.
+
+        :param int monitor_id: The monitor id.
+        :param start: The start of the window, defaults to None (the first heartbeat)
+        :param end: The end of the window, defaults to None (the last heartbeat)
+        :return: The segment.
+        :rtype: HeartbeatSegment
+        """
+        return HeartbeatSegment.encode(self.iter_beats(monitor_id, start, end), monitor_id)
+
+    def monitor_ids(self) -> list[int]:
+        """
+        :return: The ids of the monitors with archived heartbeats.
+        :rtype: list
+        """
+        with self._lock:
+            return [i[0] for i in self._db.execute("SELECT DISTINCT monitor_id FROM heartbeat ORDER BY monitor_id")]
+
+    def count(self, monitor_id: int = None) -> int:
+        """
+        :param int, optional monitor_id: The monitor id, defaults to None (all monitors)
+        :return: The number of archived heartbeats.
+        :rtype: int
+        """
+        with self._lock:
+            if monitor_id is None:
+                return self._db.execute("SELECT COUNT(*) FROM heartbeat").fetchone()[0]
+            return self._db.execute("SELECT COUNT(*) FROM heartbeat WHERE monitor_id = ?", (monitor_id,)).fetchone()[0]
+
+    def prune(self, before: datetime.datetime | str | float, monitor_id: int = None) -> int:
+        """
+        Deletes the heartbeats that are older than a time.
+
+        :param before: The time as datetime, heartbeat time string or unix timestamp.
+        :param int, optional monitor_id: The monitor id, defaults to None (all monitors)
+        :return: The number of deleted heartbeats.
+        :rtype: int
+        """
+        before = parse_heartbeat_time(before)
+        with self._lock:
+            if monitor_id is None:
+                r = self._db.execute("DELETE FROM heartbeat WHERE time < ?", (before,))
+            else:
+                r = self._db.execute("DELETE FROM heartbeat WHERE monitor_id = ? AND time < ?", (monitor_id, before))
+            self._db.commit()
+            return r.rowcount
+
+    def close(self) -> None:
+        """
+        Detaches all api instances, writes the queued heartbeats and closes the database.
+        """
+        self._detach_all()
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            self._db.close()
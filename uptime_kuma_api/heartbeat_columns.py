@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import datetime
+import math
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+
+def parse_heartbeat_time(value) -> float:
+    """
+    Converts the time of a heartbeat to a unix timestamp.
+
+    Uptime Kuma sends heartbeat times in UTC without a timezone (e.g. ``2023-01-01 12:00:00.000``).
+
+    :param value: The heartbeat time as string, datetime or unix timestamp.
+    :return: The unix timestamp in seconds.
+    :rtype: float
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def format_heartbeat_time(timestamp: float) -> str:
+    """
+    Converts a unix timestamp to the heartbeat time format of Uptime Kuma.
+
+    :param float timestamp: The unix timestamp in seconds.
+    :return: The heartbeat time in UTC, e.g. ``2023-01-01 12:00:00.000``.
+    :rtype: str
+    """
+    value = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _heartbeat_monitor_id(heartbeat, monitor_id=None) -> int | None:
+    # the heartbeat events contain monitorID, the beats of getMonitorBeats contain monitor_id
+    monitor_id = heartbeat.get("monitorID", heartbeat.get("monitor_id", monitor_id))
+    return None if monitor_id is None else int(monitor_id)
+
+
+class HeartbeatColumns(object):
+    """Stores the heartbeats of a monitor in typed arrays instead of dicts.
+
+    Each heartbeat field is kept in its own column. The ``time``, ``status``, ``ping``, ``duration`` and
+    ``important`` columns are :class:`array.array` objects and the ``msg`` strings are interned.
+    The column accessors return :class:`memoryview` objects that can be wrapped by NumPy without copying:
+
+    .. code-block:: python
+
+        import numpy as np
+
+        columns = api.get_heartbeat_columns()[1]
+        pings = np.frombuffer(columns.pings(), dtype=np.float64)
+        print(np.nanmean(pings))
+
+    Missing pings are stored as ``nan``. Iterating over the columns yields the heartbeats as dicts.
+
+    :param heartbeats: Heartbeats to add, ordered from oldest to newest.
+    :param int maxlen: How many heartbeats are kept. The oldest heartbeats are dropped. Defaults to None (unlimited).
+    """
+
+    def __init__(self, heartbeats: Iterable[dict] = (), maxlen: int = None) -> None:
+        self.maxlen = maxlen
+        self.monitor_id = None
+        self._time = array("d")
+        self._status = array("b")
+        self._ping = array("d")
+        self._duration = array("q")
+        self._important = array("b")
+        self._msg = []
+        # index of the oldest heartbeat, dropped heartbeats are removed in batches
+        self._start = 0
+        # the arrays are shared with views or snapshots and must be copied before they are changed
+        self._shared = False
+        self.extend(heartbeats)
+
+    def __len__(self) -> int:
+        return len(self._time) - self._start
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(self._start, len(self._time)):
+            yield self._heartbeat(i)
+
+    def __getitem__(self, index: int) -> dict:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("heartbeat index out of range")
+        return self._heartbeat(self._start + index)
+
+    def _heartbeat(self, i) -> dict:
+        ping = self._ping[i]
+        if math.isnan(ping):
+            ping = None
+        elif ping.is_integer():
+            ping = int(ping)
+        return {
+            "monitorID": self.monitor_id,
+            "status": self._status[i],
+            "time": format_heartbeat_time(self._time[i]),
+            "msg": self._msg[i],
+            "ping": ping,
+            "important": bool(self._important[i]),
+            "duration": self._duration[i]
+        }
+
+    def _columns(self) -> list:
+        return [self._time, self._status, self._ping, self._duration, self._important, self._msg]
+
+    def _detach(self) -> None:
+        # copies the columns so that existing views and snapshots are not changed
+        self._time, self._status, self._ping, self._duration, self._important, self._msg = [
+            column[self._start:] for column in self._columns()
+        ]
+        self._start = 0
+        self._shared = False
+
+    def append(self, heartbeat: dict) -> None:
+        """
+        Adds a heartbeat.
+
+        :param dict heartbeat: The heartbeat as sent by Uptime Kuma.
+        """
+        if self._shared:
+            self._detach()
+        if self.monitor_id is None:
+            self.monitor_id = _heartbeat_monitor_id(heartbeat)
+        ping = heartbeat.get("ping")
+        msg = heartbeat.get("msg")
+        self._time.append(parse_heartbeat_time(heartbeat["time"]))
+        self._status.append(int(heartbeat["status"]))
+        self._ping.append(math.nan if ping is None else float(ping))
+        self._duration.append(int(heartbeat.get("duration") or 0))
+        self._important.append(1 if heartbeat.get("important") else 0)
+        self._msg.append(sys.intern(msg) if isinstance(msg, str) else msg)
+
+        if self.maxlen is not None and len(self) > self.maxlen:
+            self._start += 1
+            if self._start >= self.maxlen:
+                # remove the dropped heartbeats, amortized O(1) per heartbeat
+                for column in self._columns():
+                    del column[:self._start]
+                self._start = 0
+
+    def extend(self, heartbeats: Iterable[dict]) -> None:
+        """
+        Adds multiple heartbeats.
+
+        :param heartbeats: The heartbeats, ordered from oldest to newest.
+        """
+        for heartbeat in heartbeats:
+            self.append(heartbeat)
+
+    def snapshot(self) -> HeartbeatColumns:
+        """
+        Returns a copy of the columns that shares the arrays until one of both is changed.
+
+        :return: The snapshot.
+        :rtype: HeartbeatColumns
+        """
+        snapshot = HeartbeatColumns(maxlen=self.maxlen)
+        snapshot.monitor_id = self.monitor_id
+        snapshot._time, snapshot._status, snapshot._ping, snapshot._duration, snapshot._important, snapshot._msg = self._columns()
+        snapshot._start = self._start
+        snapshot._shared = True
+        self._shared = True
+        return snapshot
+
+    def _view(self, column) -> memoryview:
+        self._shared = True
+        return memoryview(column)[self._start:]
+
+    def times(self) -> memoryview:
+        """
+        :return: The heartbeat times as unix timestamps (``float64``).
+        :rtype: memoryview
+        """
+        return self._view(self._time)
+
+    def statuses(self) -> memoryview:
+        """
+        :return: The heartbeat status codes (``int8``), see :class:`~.MonitorStatus`.
+        :rtype: memoryview
+        """
+        return self._view(self._status)
+
+    def pings(self) -> memoryview:
+        """
+        :return: The pings in milliseconds (``float64``), ``nan`` if there is no ping.
+        :rtype: memoryview
+        """
+        return self._view(self._ping)
+
+    def durations(self) -> memoryview:
+        """
+        :return: The seconds since the previous heartbeat (``int64``).
+        :rtype: memoryview
+        """
+        return self._view(self._duration)
+
+    def importants(self) -> memoryview:
+        """
+        :return: ``1`` for important heartbeats, ``0`` otherwise (``int8``).
+        :rtype: memoryview
+        """
+        return self._view(self._important)
+
+    def msgs(self) -> list:
+        """
+        :return: The heartbeat messages.
+        :rtype: list
+        """
+        return self._msg[self._start:]
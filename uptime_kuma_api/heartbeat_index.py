@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import datetime
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from .heartbeat_columns import _heartbeat_monitor_id, parse_heartbeat_time
+from .heartbeat_listener import HeartbeatListener
+from .monitor_status import is_down, is_up
+
+
+class _Series(object):
+    # cumulative sums of the heartbeats of a monitor, the first entry of each sum is 0
+
+    def __init__(self) -> None:
+        self.times = array("d")
+        self.up = array("q", [0])
+        self.down = array("q", [0])
+        self.up_duration = array("d", [0])
+        self.down_duration = array("d", [0])
+        self.ping_sum = array("d", [0])
+        self.ping_count = array("q", [0])
+
+    def _sums(self) -> list:
+        return [self.up, self.down, self.up_duration, self.down_duration, self.ping_sum, self.ping_count]
+
+    def append(self, time_, status, ping, duration) -> None:
+        up = is_up(status)
+        down = is_down(status)
+        self.times.append(time_)
+        self.up.append(self.up[-1] + up)
+        self.down.append(self.down[-1] + down)
+        self.up_duration.append(self.up_duration[-1] + (duration if up else 0))
+        self.down_duration.append(self.down_duration[-1] + (duration if down else 0))
+        has_ping = up and ping is not None
+        self.ping_sum.append(self.ping_sum[-1] + (ping if has_ping else 0))
+        self.ping_count.append(self.ping_count[-1] + has_ping)
+
+    def trim(self, count) -> None:
+        # drops the oldest heartbeats, the differences of the remaining sums do not change
+        del self.times[:count]
+        for column in self._sums():
+            del column[:count]
+
+
+class HeartbeatIndex(HeartbeatListener):
+    """Answers uptime and ping queries for arbitrary time ranges in O(log n).
+
+    For each monitor, the index keeps the heartbeat times and the cumulative number of up and down
+    heartbeats, their durations and the sum and number of pings. The aggregates of a time range are the
+    differences of the sums at both ends of the range, which are found by binary search.
+
+    The heartbeats count as up or down as described in :func:`~.monitor_status.is_up`.
+    The ping statistics include the pings of the up heartbeats.
+
+    :meth:`~attach` updates the index with each heartbeat event of a :class:`~.UptimeKumaApi` instance.
+    Heartbeats that are not newer than the last indexed heartbeat of their monitor are ignored.
+
+    Example::
+
+        >>> from uptime_kuma_api import HeartbeatIndex
+        >>> index = HeartbeatIndex()
+        >>> index.extend(api.get_monitor_beats(1, 24))
+        >>> index.attach(api)
+        >>> index.query(1, "2023-01-01 12:00:00", "2023-01-01 18:00:00")
+        {
+            'count': 360,
+            'down_count': 1,
+            'down_duration': 60.0,
+            'ping_mean': 201.5,
+            'up_count': 359,
+            'up_duration': 21540.0,
+            'uptime': 0.9972222222222222
+        }
+
+    :param int maxlen: How many heartbeats are kept for each monitor. The oldest heartbeats are dropped.
+                       Defaults to None (unlimited).
+    """
+
+    def __init__(self, maxlen: int = None) -> None:
+        super().__init__()
+        self.maxlen = maxlen
+        self._series: dict[int, _Series] = {}
+        self._lock = threading.Lock()
+
+    def append(self, heartbeat: dict, monitor_id: int = None) -> None:
+        """
+        Adds a heartbeat.
+
+        :param dict heartbeat: The heartbeat as sent by Uptime Kuma.
+        :param int, optional monitor_id: The monitor id if the heartbeat has no monitor id, defaults to None
+        """
+        monitor_id = _heartbeat_monitor_id(heartbeat, monitor_id)
+        time_ = parse_heartbeat_time(heartbeat["time"])
+        ping = heartbeat.get("ping")
+        with self._lock:
+            series = self._series.get(monitor_id)
+            if series is None:
+                series = self._series[monitor_id] = _Series()
+            elif series.times and time_ <= series.times[-1]:
+                return
+            series.append(time_, int(heartbeat["status"]), ping, float(heartbeat.get("duration") or 0))
+            if self.maxlen is not None and len(series.times) >= 2 * self.maxlen:
+                # amortized O(1) per heartbeat
+                series.trim(len(series.times) - self.maxlen)
+
+    def extend(self, heartbeats: Iterable[dict], monitor_id: int = None) -> None:
+        """
+        Adds multiple heartbeats, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`.
+
+        :param heartbeats: The heartbeats, ordered from oldest to newest.
+        :param int, optional monitor_id: The monitor id of heartbeats without monitor id,
+            e.g. of :meth:`~.UptimeKumaApi.get_heartbeats`, defaults to None
+        """
+        for heartbeat in heartbeats:
+            self.append(heartbeat, monitor_id)
+
+    def monitor_ids(self) -> list[int]:
+        """
+        :return: The ids of the indexed monitors.
+        :rtype: list
+        """
+        with self._lock:
+            return sorted(self._series)
+
+    def query(
+            self,
+            monitor_id: int,
+            start: datetime.datetime | str | float = None,
+            end: datetime.datetime | str | float = None
+    ) -> dict:
+        """
+        Aggregates the heartbeats of a monitor in a time range.
+
+        :param int monitor_id: The monitor id.
+        :param start: The start of the range as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the first heartbeat)
+        :param end: The end of the range as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the last heartbeat)
+        :return: The number of heartbeats, the number of up and down heartbeats and their durations,
+            the uptime ratio by duration and the mean ping. The uptime and the mean ping are None if there are
+            no up or down heartbeats.
+        :rtype: dict
+        """
+        with self._lock:
+            series = self._series.get(monitor_id) or _Series()
+            i = 0 if start is None else bisect_left(series.times, parse_heartbeat_time(start))
+            j = len(series.times) if end is None else bisect_right(series.times, parse_heartbeat_time(end))
+            j = max(i, j)
+            up, down, up_duration, down_duration, ping_sum, ping_count = [
+                column[j] - column[i] for column in series._sums()
+            ]
+        duration = up_duration + down_duration
+        if duration:
+            uptime = up_duration / duration
+        else:
+            # heartbeats without duration are weighted equally
+            uptime = up / (up + down) if up + down else None
+        return {
+            "count": j - i,
+            "up_count": up,
+            "down_count": down,
+            "up_duration": up_duration,
+            "down_duration": down_duration,
+            "uptime": uptime,
+            "ping_mean": ping_sum / ping_count if ping_count else None
+        }
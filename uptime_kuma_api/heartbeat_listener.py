@@ -0,0 +1,33 @@
+from .event import Event
+
+
+class HeartbeatListener(object):
+    """Base class of the heartbeat stores that can be updated by the heartbeat events of api instances.
+
+    The subclasses add a heartbeat in ``append(heartbeat)``.
+    """
+
+    def __init__(self) -> None:
+        self._apis = []
+
+    def attach(self, api) -> None:
+        """
+        Adds the heartbeat events of an api instance.
+
+        :param UptimeKumaApi api: The api instance.
+        """
+        api.on(Event.HEARTBEAT, self.append)
+        self._apis.append(api)
+
+    def detach(self, api) -> None:
+        """
+        Stops adding the heartbeat events of an api instance.
+
+        :param UptimeKumaApi api: The api instance.
+        """
+        api.off(Event.HEARTBEAT, self.append)
+        self._apis.remove(api)
+
+    def _detach_all(self) -> None:
+        for api in list(self._apis):
+            self.detach(api)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import datetime
+import math
+import threading
+from typing import Iterable
+
+from .heartbeat_columns import _heartbeat_monitor_id, parse_heartbeat_time
+from .heartbeat_listener import HeartbeatListener
+from .monitor_status import is_down, is_up
+
+
+def _insert_sorted(buckets, start, bucket) -> None:
+    # adds a bucket and keeps the buckets ordered from oldest to newest
+    late = buckets and start < next(reversed(buckets))
+    buckets[start] = bucket
+    if late:
+        items = sorted(buckets.items())
+        buckets.clear()
+        buckets.update(items)
+
+
+class HeartbeatRollup(HeartbeatListener):
+    """Aggregates heartbeats into time buckets of multiple resolutions.
+
+    Each heartbeat updates one bucket of each resolution with the number of heartbeats, the number of
+    up and down heartbeats and the minimum, maximum and sum of the pings.
+    The heartbeats count as up or down as described in :func:`~.monitor_status.is_up`.
+    The ping statistics include the pings of the up heartbeats.
+
+    For each resolution only the newest buckets are kept, so the fine resolutions cover a short period
+    and the coarse resolutions a long period. Heartbeats that arrive late are added to their bucket,
+    unless the resolution is full and the bucket would be older than its oldest kept bucket.
+    Heartbeats that have already been added (same monitor and time) are ignored. To keep the memory bounded,
+    only the times of the heartbeats in the kept buckets of the finest resolution are remembered, so late
+    heartbeats that are older than these buckets are ignored in all resolutions.
+
+    :meth:`~attach` adds each heartbeat event of a :class:`~.UptimeKumaApi` instance. Historical heartbeats,
+    e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`, are added with :meth:`~extend`.
+
+    Example::
+
+        >>> from uptime_kuma_api import HeartbeatRollup
+        >>> rollup = HeartbeatRollup()
+        >>> rollup.extend(api.get_monitor_beats(1, 24))
+        >>> rollup.attach(api)
+        >>> rollup.query(1, "2023-01-01 00:00:00", "2023-01-01 06:00:00")
+        {
+            'resolution': 60,
+            'buckets': [
+                {
+                    'count': 1,
+                    'down_count': 0,
+                    'ping_max': 193,
+                    'ping_mean': 193.0,
+                    'ping_min': 193,
+                    'start': 1672531200.0,
+                    'up_count': 1,
+                    'uptime': 1.0
+                },
+                ...
+            ]
+        }
+
+    :param dict resolutions: How many buckets are kept by bucket length in seconds.
+                             Default is 1 day of 1 minute buckets, 7 days of 5 minute buckets and
+                             90 days of 1 hour buckets.
+    """
+
+    def __init__(self, resolutions: dict[int, int] = None) -> None:
+        super().__init__()
+        if resolutions is None:
+            resolutions = {60: 1440, 300: 2016, 3600: 2160}
+        self.resolutions = dict(sorted(resolutions.items()))
+        # monitor id -> resolution -> bucket start -> [count, up, down, ping count, ping sum, ping min, ping max]
+        self._buckets: dict[int, dict[int, dict]] = {}
+        # monitor id -> time of the newest counted heartbeat
+        self._newest: dict[int, float] = {}
+        # monitor id -> kept bucket start of the finest resolution -> times of the counted heartbeats
+        self._times: dict[int, dict[int, set]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, heartbeat: dict, monitor_id: int = None) -> None:
+        """
+        Adds a heartbeat.
+
+        :param dict heartbeat: The heartbeat as sent by Uptime Kuma.
+        :param int, optional monitor_id: The monitor id if the heartbeat has no monitor id, defaults to None
+        """
+        monitor_id = _heartbeat_monitor_id(heartbeat, monitor_id)
+        timestamp = parse_heartbeat_time(heartbeat["time"])
+        status = int(heartbeat["status"])
+        up = is_up(status)
+        down = is_down(status)
+        ping = heartbeat.get("ping") if up else None
+        finest = next(iter(self.resolutions))
+        with self._lock:
+            resolutions = self._buckets.get(monitor_id)
+            if resolutions is None:
+                resolutions = self._buckets[monitor_id] = {resolution: {} for resolution in self.resolutions}
+                self._times[monitor_id] = {}
+            times = self._times[monitor_id]
+            fine_buckets = resolutions[finest]
+            key = math.floor(timestamp / finest) * finest
+            newest = self._newest.get(monitor_id)
+            if newest is not None and timestamp <= newest:
+                # the times of the counted heartbeats are only kept for the buckets of the finest resolution,
+                # an older heartbeat cannot be told apart from a duplicate
+                if fine_buckets and key < next(iter(fine_buckets)) and len(fine_buckets) >= self.resolutions[finest]:
+                    return
+                if timestamp in times.get(key, ()):
+                    return
+
+            counted = False
+            for resolution, buckets in resolutions.items():
+                start = math.floor(timestamp / resolution) * resolution
+                bucket = buckets.get(start)
+                if bucket is None:
+                    # the buckets are ordered from oldest to newest, a full resolution keeps only newer buckets
+                    if buckets and start < next(iter(buckets)) and len(buckets) >= self.resolutions[resolution]:
+                        continue
+                    bucket = [0, 0, 0, 0, 0.0, math.inf, -math.inf]
+                    _insert_sorted(buckets, start, bucket)
+                    if len(buckets) > self.resolutions[resolution]:
+                        del buckets[next(iter(buckets))]
+                bucket[0] += 1
+                bucket[1] += up
+                bucket[2] += down
+                if ping is not None:
+                    bucket[3] += 1
+                    bucket[4] += ping
+                    bucket[5] = min(bucket[5], ping)
+                    bucket[6] = max(bucket[6], ping)
+                counted = True
+
+            if counted:
+                self._newest[monitor_id] = timestamp if newest is None else max(newest, timestamp)
+                if key not in times:
+                    _insert_sorted(times, key, set())
+                times[key].add(timestamp)
+                # the times are dropped with the buckets of the finest resolution
+                oldest = next(iter(fine_buckets))
+                while next(iter(times)) < oldest:
+                    del times[next(iter(times))]
+
+    def extend(self, heartbeats: Iterable[dict], monitor_id: int = None) -> None:
+        """
+        Adds multiple heartbeats, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`.
+
+        :param heartbeats: The heartbeats, ordered from oldest to newest.
+        :param int, optional monitor_id: The monitor id of heartbeats without monitor id,
+            e.g. of :meth:`~.UptimeKumaApi.get_heartbeats`, defaults to None
+        """
+        for heartbeat in heartbeats:
+            self.append(heartbeat, monitor_id)
+
+    def monitor_ids(self) -> list[int]:
+        """
+        :return: The ids of the monitors with buckets.
+        :rtype: list
+        """
+        with self._lock:
+            return sorted(self._buckets)
+
+    def _select_resolution(self, resolutions, start, end, max_buckets) -> int:
+        # the finest resolution that covers the start of the window with at most max_buckets buckets,
+        # otherwise the coarsest resolution
+        for resolution, buckets in resolutions.items():
+            if not buckets or next(iter(buckets)) > start:
+                continue
+            if (end - start) / resolution <= max_buckets:
+                return resolution
+        return next(reversed(self.resolutions))
+
+    def query(
+            self,
+            monitor_id: int,
+            start: datetime.datetime | str | float,
+            end: datetime.datetime | str | float = None,
+            resolution: int = None,
+            max_buckets: int = 500
+    ) -> dict:
+        """
+        Returns the buckets of a monitor in a time window.
+
+        If no resolution is given, the finest resolution is selected whose buckets go back to the start of the
+        window and that returns at most ``max_buckets`` buckets. If there is none, the coarsest resolution is used.
+        Short windows keep the detail of the fine resolutions instead of always using the coarsest resolution
+        that covers the window, and long windows never return more than ``max_buckets`` buckets.
+
+        :param int monitor_id: The monitor id.
+        :param start: The start of the window as datetime, heartbeat time string or unix timestamp.
+        :param end: The end of the window as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the newest bucket)
+        :param int, optional resolution: The bucket length in seconds, one of the ``resolutions``,
+            defaults to None (selected by the window)
+        :param int, optional max_buckets: The maximum number of buckets for the selection of the resolution,
+            defaults to 500
+        :return: The resolution and the buckets with the start as unix timestamp, the number of heartbeats,
+            the number of up and down heartbeats, the uptime ratio and the minimum, maximum and mean ping.
+            The uptime and the ping statistics are None if there are no values. Buckets without heartbeats
+            are omitted.
+        :rtype: dict
+        :raises ValueError: If the resolution is not one of the ``resolutions``.
+        """
+        if resolution is not None and resolution not in self.resolutions:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        start = parse_heartbeat_time(start)
+        end = math.inf if end is None else parse_heartbeat_time(end)
+        with self._lock:
+            resolutions = self._buckets.get(monitor_id) or {i: {} for i in self.resolutions}
+            if resolution is None:
+                newest = max((next(reversed(i)) for i in resolutions.values() if i), default=start)
+                resolution = self._select_resolution(resolutions, start, min(end, newest), max_buckets)
+            first = math.floor(start / resolution) * resolution
+            buckets = [
+                (bucket_start, list(bucket)) for bucket_start, bucket in resolutions[resolution].items()
+                if first <= bucket_start <= end
+            ]
+
+        r = []
+        for bucket_start, (count, up, down, ping_count, ping_sum, ping_min, ping_max) in buckets:
+            r.append({
+                "start": float(bucket_start),
+                "count": count,
+                "up_count": up,
+                "down_count": down,
+                "uptime": up / (up + down) if up + down else None,
+                "ping_min": ping_min if ping_count else None,
+                "ping_max": ping_max if ping_count else None,
+                "ping_mean": ping_sum / ping_count if ping_count else None
+            })
+        return {
+            "resolution": resolution,
+            "buckets": r
+        }
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import datetime
+import mmap
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator
+
+from .heartbeat_columns import _heartbeat_monitor_id, format_heartbeat_time, parse_heartbeat_time
+from .monitor_status import MonitorStatus
+
+_MAGIC = b"UKHS"
+_VERSION = 1
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    # unsigned LEB128
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos: int) -> tuple:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _write_runs(out: bytearray, values) -> None:
+    # run-length encoding as number of runs and (value, length) pairs
+    runs = []
+    for value in values:
+        if runs and runs[-1][0] == value:
+            runs[-1][1] += 1
+        else:
+            runs.append([value, 1])
+    _write_varint(out, len(runs))
+    for value, length in runs:
+        _write_varint(out, value)
+        _write_varint(out, length)
+
+
+def _read_runs(data, pos: int) -> tuple:
+    values = []
+    count, pos = _read_varint(data, pos)
+    for _ in range(count):
+        value, pos = _read_varint(data, pos)
+        length, pos = _read_varint(data, pos)
+        values += [value] * length
+    return values, pos
+
+
+def _write_deltas(out: bytearray, values) -> None:
+    # zig-zag encoded differences to the previous value
+    previous = 0
+    for value in values:
+        _write_varint(out, _zigzag(value - previous))
+        previous = value
+
+
+def _read_deltas(data, pos: int, count: int) -> tuple:
+    values = []
+    value = 0
+    for _ in range(count):
+        delta, pos = _read_varint(data, pos)
+        value += _unzigzag(delta)
+        values.append(value)
+    return values, pos
+
+
+class HeartbeatSegment(object):
+    """A compact binary encoding of the heartbeats of a monitor.
+
+    The heartbeats are split into blocks of ``block_size`` heartbeats. Each block stores its columns separately:
+    the times as varint deltas in milliseconds, the status and the important flag run-length encoded,
+    the ping and the duration as zig-zag encoded varint deltas and the message as run-length encoded index
+    into the string table of the segment. A block index with the time range of each block allows to
+    decode only the blocks of a requested time range.
+
+    Pings are stored as integer milliseconds.
+
+    Segments are created with :meth:`~encode` and read from bytes or with :meth:`~open` from a file
+    through a memory map. :meth:`~close` closes the memory map, segments can be used as context manager.
+
+    Example::
+
+        >>> from uptime_kuma_api import HeartbeatSegment
+        >>> segment = HeartbeatSegment.encode(api.get_monitor_beats(1, 24), monitor_id=1)
+        >>> len(segment.data)
+        2841
+        >>> segment.write("monitor-1.ukhs")
+        >>> with HeartbeatSegment.open("monitor-1.ukhs") as segment:
+        ...     list(segment.iter_range("2023-01-01 12:00:00", "2023-01-01 13:00:00"))
+        [
+            {
+                'duration': 60,
+                'important': False,
+                'monitorID': 1,
+                'msg': '200 - OK',
+                'ping': 193,
+                'status': <MonitorStatus.UP: 1>,
+                'time': '2023-01-01 12:00:42.878'
+            },
+            ...
+        ]
+
+    :param bytes data: The encoded segment.
+    :raises ValueError: If the data is not a heartbeat segment.
+    """
+
+    def __init__(self, data: bytes | memoryview | mmap.mmap) -> None:
+        self.data = data
+        if bytes(data[:4]) != _MAGIC or data[4] != _VERSION:
+            raise ValueError("not a heartbeat segment")
+        pos = 5
+        monitor_id, pos = _read_varint(data, pos)
+        self.monitor_id = monitor_id - 1 if monitor_id else None
+        """The id of the monitor or None."""
+
+        # block index
+        block_count, pos = _read_varint(data, pos)
+        self._block_starts = []
+        self._block_ends = []
+        self._blocks = []
+        offset = 0
+        for _ in range(block_count):
+            start, pos = _read_varint(data, pos)
+            length, pos = _read_varint(data, pos)
+            size, pos = _read_varint(data, pos)
+            count, pos = _read_varint(data, pos)
+            self._block_starts.append(start)
+            self._block_ends.append(start + length)
+            self._blocks.append((offset, count))
+            offset += size
+
+        # string table
+        string_count, pos = _read_varint(data, pos)
+        self._strings = []
+        for _ in range(string_count):
+            length, pos = _read_varint(data, pos)
+            if length == 0:
+                self._strings.append(None)
+                continue
+            length -= 1
+            self._strings.append(bytes(data[pos:pos + length]).decode())
+            pos += length
+        self._data_start = pos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(count for _, count in self._blocks)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter_range()
+
+    @classmethod
+    def encode(cls, heartbeats: Iterable[dict], monitor_id: int = None, block_size: int = 1024) -> HeartbeatSegment:
+        """
+        Encodes heartbeats.
+
+        :param heartbeats: The heartbeats, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`. They are sorted by time.
+        :param int, optional monitor_id: The monitor id, defaults to None (the monitor id of the first heartbeat)
+        :param int, optional block_size: How many heartbeats are stored in a block, defaults to 1024
+        :return: The segment.
+        :rtype: HeartbeatSegment
+        :raises ValueError: If the block size is less than 1.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        rows = []
+        for heartbeat in heartbeats:
+            if monitor_id is None:
+                monitor_id = _heartbeat_monitor_id(heartbeat)
+            ping = heartbeat.get("ping")
+            rows.append((
+                round(parse_heartbeat_time(heartbeat["time"]) * 1000),
+                int(heartbeat["status"]),
+                0 if ping is None else round(ping) + 1,
+                int(heartbeat.get("duration") or 0),
+                1 if heartbeat.get("important") else 0,
+                heartbeat.get("msg")
+            ))
+        rows.sort(key=lambda i: i[0])
+
+        strings = {}
+        index = bytearray()
+        blocks = bytearray()
+        blocks_count = 0
+        for i in range(0, len(rows), block_size):
+            times, statuses, pings, durations, important, msgs = zip(*rows[i:i + block_size])
+            block = bytearray()
+            # the rows are sorted by time, so the time deltas are not negative
+            _write_varint(block, 0)
+            previous = times[0]
+            for time_ in times[1:]:
+                _write_varint(block, time_ - previous)
+                previous = time_
+            _write_runs(block, statuses)
+            _write_deltas(block, pings)
+            _write_deltas(block, durations)
+            _write_runs(block, important)
+            _write_runs(block, [strings.setdefault(msg, len(strings)) for msg in msgs])
+
+            _write_varint(index, times[0])
+            _write_varint(index, times[-1] - times[0])
+            _write_varint(index, len(block))
+            _write_varint(index, len(times))
+            blocks += block
+            blocks_count += 1
+
+        out = bytearray(_MAGIC)
+        out.append(_VERSION)
+        _write_varint(out, 0 if monitor_id is None else int(monitor_id) + 1)
+        _write_varint(out, blocks_count)
+        out += index
+        _write_varint(out, len(strings))
+        for msg in strings:
+            if msg is None:
+                _write_varint(out, 0)
+                continue
+            msg = str(msg).encode()
+            _write_varint(out, len(msg) + 1)
+            out += msg
+        out += blocks
+        return cls(bytes(out))
+
+    @classmethod
+    def open(cls, path: str) -> HeartbeatSegment:
+        """
+        Reads a segment file through a memory map. Only the accessed blocks are read from disk.
+
+        :param str path: The path of the file.
+        :return: The segment.
+        :rtype: HeartbeatSegment
+        :raises ValueError: If the file is not a heartbeat segment.
+        """
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def close(self) -> None:
+        """
+        Closes the memory map of a segment that has been read with :meth:`~open`.
+        The heartbeats cannot be read anymore.
+        """
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def write(self, path: str) -> None:
+        """
+        Writes the segment to a file.
+
+        :param str path: The path of the file.
+        """
+        with open(path, "wb") as f:
+            f.write(self.data)
+
+    def _decode_block(self, i) -> list:
+        offset, count = self._blocks[i]
+        data = self.data
+        pos = self._data_start + offset
+        times = []
+        time_ = self._block_starts[i]
+        for _ in range(count):
+            delta, pos = _read_varint(data, pos)
+            time_ += delta
+            times.append(time_)
+        statuses, pos = _read_runs(data, pos)
+        pings, pos = _read_deltas(data, pos, count)
+        durations, pos = _read_deltas(data, pos, count)
+        important, pos = _read_runs(data, pos)
+        msgs, pos = _read_runs(data, pos)
+        return list(zip(times, statuses, pings, durations, important, msgs))
+
+    def iter_range(
+            self,
+            start: datetime.datetime | str | float = None,
+            end: datetime.datetime | str | float = None
+    ) -> Iterator[dict]:
+        """
+        Iterates over the heartbeats in a time range, ordered by time.
+
+        Only the blocks that overlap the time range are decoded.
+
+        :param start: The start of the range as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the first heartbeat)
+        :param end: The end of the range as datetime, heartbeat time string or unix timestamp,
+            defaults to None (the last heartbeat)
+        :return: The heartbeats.
+        :rtype: Iterator
+        """
+        start = -1 if start is None else round(parse_heartbeat_time(start) * 1000)
+        end = float("inf") if end is None else round(parse_heartbeat_time(end) * 1000)
+        first = bisect_left(self._block_ends, start)
+        last = bisect_right(self._block_starts, end)
+        for i in range(first, last):
+            for time_, status, ping, duration, important, msg in self._decode_block(i):
+                if start <= time_ <= end:
+                    yield {
+                        "monitorID": self.monitor_id,
+                        "status": MonitorStatus(status),
+                        "time": format_heartbeat_time(time_ / 1000),
+                        "msg": self._strings[msg],
+                        "ping": ping - 1 if ping else None,
+                        "important": bool(important),
+                        "duration": duration
+                    }
+
+    def decode(self) -> list[dict]:
+        """
+        Decodes all heartbeats.
+
+        :return: The heartbeats, ordered by time.
+        :rtype: list
+        """
+        return list(self.iter_range())
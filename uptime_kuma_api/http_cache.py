@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import requests
+
+from .exceptions import Timeout
+
+# the body of a cached response has not been parsed yet
+_NOT_PARSED = object()
+
+
+class HttpCache(object):
+    """Caches the responses of HTTP GET requests by url.
+
+    Cached responses are revalidated with the ``ETag`` and ``Last-Modified`` headers of the response.
+    If the resource has not changed, the server answers with ``304 Not Modified`` and the cached
+    response is returned without downloading the body again. Within ``ttl`` seconds after a response
+    has been received or revalidated, it is returned without a request. When ``maxsize`` responses
+    are cached, the least recently used response is dropped.
+
+    Only successful responses are cached. Responses with ``Cache-Control: no-store`` are not cached.
+
+    :meth:`~get_json` parses the body of a cached response only once and returns a copy of the parsed body
+    as long as the response is cached.
+
+    :param int maxsize: How many responses are cached. ``0`` disables the cache. Default is ``128``.
+    :param float ttl: How many seconds a response is used without revalidation. Default is ``0``
+                      (each request is revalidated).
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        # url -> (response, validators, expires, parsed body), ordered from least to most recently used
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session: requests.Session, url: str, timeout: float = None) -> requests.Response:
+        """
+        Sends a GET request or returns the cached response.
+
+        :param requests.Session session: The session that sends the request.
+        :param str url: The url of the resource.
+        :param float, optional timeout: How many seconds to wait for the server, defaults to None (no limit)
+        :return: The response. Cached responses are shared and must not be modified.
+        :rtype: requests.Response
+        :raises Timeout: If the server does not respond in time.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry:
+                self._entries.move_to_end(url)
+                if entry[2] > time.monotonic():
+                    return entry[0]
+
+        headers = entry[1] if entry else {}
+        try:
+            r = session.get(url, headers=headers, timeout=timeout)
+        except requests.exceptions.Timeout as e:
+            raise Timeout(e)
+
+        if r.status_code == 304 and entry:
+            # the cached response is still valid
+            self._store(url, entry[0], entry[1], entry[3])
+            return entry[0]
+        validators = {}
+        if "ETag" in r.headers:
+            validators["If-None-Match"] = r.headers["ETag"]
+        if "Last-Modified" in r.headers:
+            validators["If-Modified-Since"] = r.headers["Last-Modified"]
+        if r.ok and (validators or self.ttl > 0) and "no-store" not in r.headers.get("Cache-Control", ""):
+            self._store(url, r, validators)
+        else:
+            self.invalidate(url)
+        return r
+
+    def get_json(self, session: requests.Session, url: str, timeout: float = None) -> tuple[requests.Response, Any]:
+        """
+        Sends a GET request or returns the cached response, like :meth:`~get`, and parses the JSON body.
+
+        :param requests.Session session: The session that sends the request.
+        :param str url: The url of the resource.
+        :param float, optional timeout: How many seconds to wait for the server, defaults to None (no limit)
+        :return: The response and a copy of the parsed body that can be modified.
+            The body is None if an error response has no JSON body.
+        :rtype: tuple
+        :raises Timeout: If the server does not respond in time.
+        """
+        r = self.get(session, url, timeout)
+        with self._lock:
+            entry = self._entries.get(url)
+            cached = entry is not None and entry[0] is r
+            data = entry[3] if cached else _NOT_PARSED
+        if not cached:
+            # error responses are not cached and may have no JSON body
+            try:
+                return r, r.json()
+            except ValueError:
+                if r.ok:
+                    raise
+                return r, None
+        if data is _NOT_PARSED:
+            data = r.json()
+            with self._lock:
+                entry = self._entries.get(url)
+                if entry is not None and entry[0] is r:
+                    self._entries[url] = entry[:3] + (data,)
+        return r, copy.deepcopy(data)
+
+    def _store(self, url, response, validators, data=_NOT_PARSED) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[url] = (response, validators, time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """
+        Drops the cached response of an url.
+
+        :param str url: The url of the resource.
+        """
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def clear(self) -> None:
+        """
+        Drops all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -15,3 +15,33 @@ class MonitorStatus(int, Enum):
 
     MAINTENANCE = 3
     """MAINTENANCE"""
+
+
+UP_STATUSES = (MonitorStatus.UP, MonitorStatus.MAINTENANCE)
+DOWN_STATUSES = (MonitorStatus.DOWN, MonitorStatus.PENDING)
+
+
+def is_up(status: int) -> bool:
+    """
+    Returns if a heartbeat status counts as up in uptime statistics.
+
+    The statuses are counted like the uptime of Uptime Kuma: :attr:`~.MonitorStatus.UP` and
+    :attr:`~.MonitorStatus.MAINTENANCE` heartbeats count as up, :attr:`~.MonitorStatus.DOWN` and
+    :attr:`~.MonitorStatus.PENDING` heartbeats count as down.
+
+    :param int status: The status of the heartbeat.
+    :return: True if the status counts as up.
+    :rtype: bool
+    """
+    return status in UP_STATUSES
+
+
+def is_down(status: int) -> bool:
+    """
+    Returns if a heartbeat status counts as down in uptime statistics. See :func:`is_up`.
+
+    :param int status: The status of the heartbeat.
+    :return: True if the status counts as down.
+    :rtype: bool
+    """
+    return status in DOWN_STATUSES
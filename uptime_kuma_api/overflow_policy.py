@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class OverflowPolicy(str, Enum):
+    """Enumerate what happens when the queue of a subscription is full."""
+
+    DROP = "drop"
+    """Drop new messages until the subscriber has consumed older ones."""
+
+    BLOCK = "block"
+    """Block the event handler until the subscriber has consumed older messages. This also delays all other events and server responses."""
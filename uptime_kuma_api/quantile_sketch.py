@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import datetime
+import math
+import threading
+import time
+from typing import Iterable
+
+from .heartbeat_columns import _heartbeat_monitor_id, parse_heartbeat_time
+from .heartbeat_listener import HeartbeatListener
+
+
+class QuantileSketch(object):
+    """A mergeable streaming quantile sketch with relative accuracy (DDSketch).
+
+    Values are counted in buckets whose bounds grow exponentially, so each quantile is returned with a
+    relative error of at most ``relative_accuracy``. When there are more than ``max_buckets`` buckets,
+    the lowest buckets are collapsed, which keeps the memory constant and the accuracy of the high quantiles.
+    Sketches with the same accuracy can be merged without losing accuracy.
+
+    Example::
+
+        >>> from uptime_kuma_api import QuantileSketch
+        >>> sketch = QuantileSketch()
+        >>> for beat in api.get_monitor_beats(1, 24):
+        ...     sketch.add(beat["ping"])
+        >>> sketch.quantile(0.99)
+        512.3
+
+    :param float relative_accuracy: The maximum relative error of the quantiles. Default is ``0.01``.
+    :param int max_buckets: How many buckets are kept. Default is ``2048``.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        """The number of values."""
+        self.sum = 0.0
+        """The sum of the values."""
+        self.min = math.inf
+        """The smallest value."""
+        self.max = -math.inf
+        """The largest value."""
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        # values that are too small for a bucket
+        self._zero_count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Adds a value. Negative values are counted as ``0``.
+
+        :param float value: The value.
+        :param int, optional count: How often the value is added, defaults to 1
+        """
+        if value is None:
+            return
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 1e-9:
+            self._zero_count += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        # merges the lowest buckets into the lowest kept bucket
+        keys = sorted(self._buckets)
+        excess = keys[:len(keys) - self.max_buckets + 1]
+        self._buckets[keys[len(excess)]] += sum(self._buckets.pop(key) for key in excess)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """
+        Adds the values of another sketch.
+
+        :param QuantileSketch other: The sketch.
+        :raises ValueError: If the sketches have a different relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("sketches with different relative accuracy cannot be merged")
+        if not other.count:
+            return
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._zero_count += other._zero_count
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def copy(self) -> QuantileSketch:
+        """
+        :return: A copy of the sketch.
+        :rtype: QuantileSketch
+        """
+        r = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        r.merge(self)
+        return r
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Returns the approximate value at a quantile.
+
+        :param float q: The quantile between ``0`` and ``1``, e.g. ``0.95``.
+        :return: The value or None if the sketch is empty.
+        :rtype: float
+        :raises ValueError: If the quantile is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                value = 2 * self._gamma ** key / (self._gamma + 1)
+                # the exact bounds are known
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> dict[float, float | None]:
+        """
+        Returns the approximate values at multiple quantiles.
+
+        :param list qs: The quantiles between ``0`` and ``1``.
+        :return: The value of each quantile.
+        :rtype: dict
+        """
+        return {q: self.quantile(q) for q in qs}
+
+    @property
+    def mean(self) -> float | None:
+        """
+        The mean of the values or None if the sketch is empty.
+
+        :rtype: float
+        """
+        return self.sum / self.count if self.count else None
+
+
+class WindowedQuantileSketch(object):
+    """A quantile sketch of the values of the last ``window`` seconds.
+
+    The window is split into ``slots`` rotating sketches. Values older than the window are dropped
+    with their slot, so the window is accurate to ``window / slots`` seconds.
+
+    :param float window: The length of the window in seconds.
+    :param int slots: How many sketches the window is split into. Default is ``12``.
+    :param float relative_accuracy: The maximum relative error of the quantiles. Default is ``0.01``.
+    :param int max_buckets: How many buckets each sketch keeps. Default is ``2048``.
+    """
+
+    def __init__(self, window: float, slots: int = 12, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        self.window = window
+        self.slots = slots
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._slot_length = window / slots
+        # (slot number, sketch) at position slot number % slots
+        self._ring: list = [None] * slots
+
+    def add(self, value: float, timestamp: float = None) -> None:
+        """
+        Adds a value.
+
+        :param float value: The value.
+        :param float, optional timestamp: The unix timestamp of the value, defaults to None (now)
+        """
+        if value is None:
+            return
+        slot = math.floor((time.time() if timestamp is None else timestamp) / self._slot_length)
+        position = slot % self.slots
+        entry = self._ring[position]
+        if entry is None or entry[0] < slot:
+            entry = self._ring[position] = (slot, QuantileSketch(self.relative_accuracy, self.max_buckets))
+        elif entry[0] > slot:
+            # older than the window
+            return
+        entry[1].add(value)
+
+    def sketch(self, now: float = None) -> QuantileSketch:
+        """
+        Merges the sketches of the window.
+
+        :param float, optional now: The unix timestamp of the end of the window, defaults to None (now)
+        :return: The sketch of the values in the window.
+        :rtype: QuantileSketch
+        """
+        last = math.floor((time.time() if now is None else now) / self._slot_length)
+        r = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        for entry in self._ring:
+            if entry is not None and last - self.slots < entry[0] <= last:
+                r.merge(entry[1])
+        return r
+
+
+class LatencySketches(HeartbeatListener):
+    """Keeps quantile sketches of the pings of each monitor for multiple windows.
+
+    :meth:`~attach` adds the ping of each heartbeat event of a :class:`~.UptimeKumaApi` instance.
+    The memory of each monitor is constant regardless of the heartbeat rate.
+    The sketches of multiple monitors, e.g. of a tag or of the instances of a :class:`~.UptimeKumaFleet`,
+    can be merged.
+
+    Example::
+
+        >>> from uptime_kuma_api import LatencySketches
+        >>> sketches = LatencySketches(windows=(3600, 86400))
+        >>> sketches.attach(api)
+        >>> sketches.quantiles(1, 3600)
+        {
+            0.5: 195.2,
+            0.95: 301.7,
+            0.99: 512.3
+        }
+        >>> monitor_ids = [i["id"] for i in api.get_monitors_by_tag(1)]
+        >>> sketches.merged(86400, monitor_ids).quantile(0.99)
+        640.1
+
+    :param list windows: The lengths of the windows in seconds. Default is 1 hour and 24 hours.
+    :param int slots: How many sketches each window is split into. Default is ``12``.
+    :param float relative_accuracy: The maximum relative error of the quantiles. Default is ``0.01``.
+    """
+
+    def __init__(self, windows: Iterable[float] = (3600, 86400), slots: int = 12, relative_accuracy: float = 0.01) -> None:
+        super().__init__()
+        self.windows = tuple(windows)
+        self.slots = slots
+        self.relative_accuracy = relative_accuracy
+        self._sketches: dict[int, dict[float, WindowedQuantileSketch]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, heartbeat: dict, monitor_id: int = None) -> None:
+        """
+        Adds the ping of a heartbeat.
+
+        :param dict heartbeat: The heartbeat as sent by Uptime Kuma.
+        :param int, optional monitor_id: The monitor id if the heartbeat has no monitor id, defaults to None
+        """
+        ping = heartbeat.get("ping")
+        if ping is None:
+            return
+        monitor_id = _heartbeat_monitor_id(heartbeat, monitor_id)
+        timestamp = parse_heartbeat_time(heartbeat["time"])
+        with self._lock:
+            sketches = self._sketches.get(monitor_id)
+            if sketches is None:
+                sketches = self._sketches[monitor_id] = {
+                    window: WindowedQuantileSketch(window, self.slots, self.relative_accuracy) for window in self.windows
+                }
+            for sketch in sketches.values():
+                sketch.add(ping, timestamp)
+
+    def extend(self, heartbeats: Iterable[dict], monitor_id: int = None) -> None:
+        """
+        Adds the pings of multiple heartbeats, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`.
+
+        :param heartbeats: The heartbeats.
+        :param int, optional monitor_id: The monitor id of heartbeats without monitor id, defaults to None
+        """
+        for heartbeat in heartbeats:
+            self.append(heartbeat, monitor_id)
+
+    def monitor_ids(self) -> list[int]:
+        """
+        :return: The ids of the monitors with sketches.
+        :rtype: list
+        """
+        with self._lock:
+            return sorted(self._sketches)
+
+    def sketch(self, monitor_id: int, window: float, now: datetime.datetime | str | float = None) -> QuantileSketch:
+        """
+        Returns the sketch of the pings of a monitor in a window.
+
+        :param int monitor_id: The monitor id.
+        :param float window: One of the ``windows``.
+        :param now: The end of the window as datetime, heartbeat time string or unix timestamp, defaults to None (now)
+        :return: The sketch.
+        :rtype: QuantileSketch
+        :raises ValueError: If the window is not one of the ``windows``.
+        """
+        if window not in self.windows:
+            raise ValueError(f"Unknown window: {window}")
+        now = None if now is None else parse_heartbeat_time(now)
+        with self._lock:
+            sketches = self._sketches.get(monitor_id)
+            if sketches is None:
+                return QuantileSketch(self.relative_accuracy)
+            return sketches[window].sketch(now)
+
+    def quantiles(
+            self,
+            monitor_id: int,
+            window: float,
+            qs: Iterable[float] = (0.5, 0.95, 0.99),
+            now: datetime.datetime | str | float = None
+    ) -> dict[float, float | None]:
+        """
+        Returns the ping quantiles of a monitor in a window.
+
+        :param int monitor_id: The monitor id.
+        :param float window: One of the ``windows``.
+        :param list, optional qs: The quantiles, defaults to ``(0.5, 0.95, 0.99)``
+        :param now: The end of the window, defaults to None (now)
+        :return: The ping of each quantile, None if there are no pings.
+        :rtype: dict
+        :raises ValueError: If the window is not one of the ``windows``.
+        """
+        return self.sketch(monitor_id, window, now).quantiles(qs)
+
+    def merged(
+            self,
+            window: float,
+            monitor_ids: Iterable[int] = None,
+            now: datetime.datetime | str | float = None
+    ) -> QuantileSketch:
+        """
+        Merges the sketches of multiple monitors in a window.
+
+        :param float window: One of the ``windows``.
+        :param list, optional monitor_ids: The monitor ids, defaults to None (all monitors)
+        :param now: The end of the window, defaults to None (now)
+        :return: The merged sketch.
+        :rtype: QuantileSketch
+        :raises ValueError: If the window is not one of the ``windows``.
+        """
+        if monitor_ids is None:
+            monitor_ids = self.monitor_ids()
+        r = QuantileSketch(self.relative_accuracy)
+        for monitor_id in monitor_ids:
+            r.merge(self.sketch(monitor_id, window, now))
+        return r
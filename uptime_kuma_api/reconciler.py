@@ -0,0 +1,554 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from copy import deepcopy
+from typing import Any, Callable
+
+from . import ProxyProtocol, UptimeKumaException
+from .api import (
+    UptimeKumaApi,
+    _build_notification_data,
+    _build_proxy_data,
+    _build_tag_data,
+    _check_arguments_maintenance,
+    _check_arguments_monitor,
+    _check_arguments_notification,
+    _check_arguments_proxy,
+    _check_arguments_tag,
+    _convert_monitor_input,
+    _run_concurrently
+)
+
+
+def fingerprint(data: Any) -> str:
+    """
+    Calculates a fingerprint of the content of a configuration.
+
+    Two configurations have the same fingerprint if they contain the same values, regardless of the order of dict keys.
+
+    :param data: The configuration.
+    :return: The fingerprint.
+    :rtype: str
+    """
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def _project(current, desired) -> Any:
+    # reduces the current configuration to the keys of the desired configuration
+    if isinstance(desired, dict) and isinstance(current, dict):
+        return {key: _project(current.get(key), value) for key, value in desired.items()}
+    if isinstance(desired, list) and isinstance(current, list) and len(desired) == len(current):
+        return [_project(i, j) for i, j in zip(current, desired)]
+    return current
+
+
+def _changed_keys(current, desired) -> list[str]:
+    # returns the keys of the desired configuration whose values differ from the current configuration
+    if fingerprint(_project(current, desired)) == fingerprint(desired):
+        return []
+    return [key for key, value in desired.items() if fingerprint(_project(current.get(key), value)) != fingerprint(value)]
+
+
+def _proxy_key(proxy) -> str:
+    return f"{ProxyProtocol(proxy['protocol']).value}://{proxy['host']}:{proxy['port']}"
+
+
+class _Ref(object):
+    # a reference to an entity that does not exist yet and gets its id when the plan is applied
+
+    def __init__(self, resource, key) -> None:
+        self.resource = resource
+        self.key = key
+
+    def __str__(self) -> str:
+        return f"<{self.resource} '{self.key}'>"
+
+
+class ReconcileOperation(object):
+    """An operation of a :class:`ReconcilePlan`.
+
+    After the plan has been applied, :attr:`result` contains the server response or :attr:`error` the exception.
+    """
+
+    def __init__(self, action: str, resource: str, key: str, func: Callable, changes: list[str] = None) -> None:
+        self.action = action
+        """The action: ``add``, ``edit`` or ``delete``."""
+
+        self.resource = resource
+        """The resource type, e.g. ``monitor``."""
+
+        self.key = key
+        """The name, title or slug of the entity."""
+
+        self.changes = changes or []
+        """The changed keys of an edit."""
+
+        self.result = None
+        """The server response after the operation has been applied."""
+
+        self.error = None
+        """The exception if the operation has failed."""
+
+        self._func = func
+
+    def __str__(self) -> str:
+        symbol = {"add": "+", "edit": "~", "delete": "-"}[self.action]
+        r = f"{symbol} {self.action} {self.resource} '{self.key}'"
+        if self.changes:
+            r += f" ({', '.join(self.changes)})"
+        return r
+
+    def __repr__(self) -> str:
+        return f"<ReconcileOperation {self}>"
+
+
+class ReconcilePlan(object):
+    """The operations that are needed to reach a desired state, created by :meth:`Reconciler.plan`.
+
+    The operations of a wave only depend on the operations of the previous waves and are applied concurrently.
+    ``str(plan)`` returns a readable plan for a dry run.
+    """
+
+    def __init__(self) -> None:
+        self.waves: list[list[ReconcileOperation]] = []
+        """The waves of operations in the order in which they are applied."""
+
+        # ids of the entities by resource type and key, completed when the plan is applied
+        self._ids: dict = {}
+
+    @property
+    def operations(self) -> list[ReconcileOperation]:
+        """All operations in the order in which they are applied."""
+        return [operation for wave in self.waves for operation in wave]
+
+    @property
+    def errors(self) -> list[ReconcileOperation]:
+        """The failed operations after the plan has been applied."""
+        return [operation for operation in self.operations if operation.error is not None]
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __str__(self) -> str:
+        if not self.waves:
+            return "No changes."
+        lines = []
+        for i, wave in enumerate(self.waves, 1):
+            lines.append(f"wave {i}:")
+            lines.extend(f"  {operation}" for operation in wave)
+        return "\n".join(lines)
+
+    def _resolve(self, data) -> Any:
+        # replaces the references with the ids of the entities that have been added
+        if isinstance(data, _Ref):
+            id_ = self._ids.get((data.resource, data.key))
+            if id_ is None:
+                raise UptimeKumaException(f"{data.resource} '{data.key}' does not exist")
+            return id_
+        if isinstance(data, dict):
+            return {key: self._resolve(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._resolve(i) for i in data]
+        return data
+
+
+class Reconciler(object):
+    """Brings an Uptime Kuma server into a desired state.
+
+    The desired state is a dict with the optional keys ``notifications``, ``tags``, ``proxies``, ``monitors``,
+    ``maintenances`` and ``status_pages``. Each key contains a list with the arguments of the corresponding
+    ``add_*`` method. Entities are matched by their name (notifications, tags and monitors), their title
+    (maintenances), their slug (status pages) or ``protocol://host:port`` (proxies).
+
+    References to other entities can be given by name instead of id:
+
+    - monitor ``notificationIDList``: notification names
+    - monitor ``parent``: monitor name
+    - monitor ``proxyId``: proxy ``protocol://host:port``
+    - monitor ``tags``: list of ``{"name": tag name, "value": value}``
+    - maintenance ``monitors``: monitor names
+    - maintenance ``status_pages``: status page slugs
+    - status page ``publicGroupList``: the ``monitorList`` may contain monitor names
+
+    The desired state is compared with the current state by content fingerprints.
+    Only the keys that are given in the desired state are compared, other values are kept.
+    All entities are validated before the first operation is applied.
+
+    Example::
+
+        >>> from uptime_kuma_api import UptimeKumaApi, Reconciler, MonitorType, NotificationType
+        >>> api = UptimeKumaApi('INSERT_URL')
+        >>> api.login('INSERT_USERNAME', 'INSERT_PASSWORD')
+        >>> reconciler = Reconciler(api)
+        >>> plan = reconciler.plan({
+        ...     "notifications": [
+        ...         {
+        ...             "name": "ops",
+        ...             "type": NotificationType.PUSHBULLET,
+        ...             "pushbulletAccessToken": "123456789"
+        ...         }
+        ...     ],
+        ...     "monitors": [
+        ...         {
+        ...             "type": MonitorType.GROUP,
+        ...             "name": "websites"
+        ...         },
+        ...         {
+        ...             "type": MonitorType.HTTP,
+        ...             "name": "Google",
+        ...             "url": "https://google.com",
+        ...             "parent": "websites",
+        ...             "notificationIDList": ["ops"]
+        ...         }
+        ...     ]
+        ... })
+        >>> print(plan)
+        wave 1:
+          + add notification 'ops'
+        wave 2:
+          + add monitor 'websites'
+        wave 3:
+          + add monitor 'Google'
+        >>> reconciler.apply(plan).errors
+        []
+
+    :param UptimeKumaApi api: The logged in api.
+    :param bool, optional prune: Delete the entities that are not in the desired state. Only the resource types
+        that are given in the desired state are pruned. Defaults to False
+    :param int, optional concurrency: How many operations of a wave are applied at the same time, defaults to 10
+    """
+
+    def __init__(self, api: UptimeKumaApi, prune: bool = False, concurrency: int = 10) -> None:
+        self.api = api
+        self.prune = prune
+        self.concurrency = concurrency
+
+    def reconcile(self, state: dict, dry_run: bool = False) -> ReconcilePlan:
+        """
+        Plans and applies the operations to reach the desired state.
+
+        :param dict state: The desired state.
+        :param bool, optional dry_run: Only print the plan, defaults to False
+        :return: The plan.
+        :rtype: ReconcilePlan
+        :raises TypeError: If an argument is missing.
+        :raises ValueError: If an argument is invalid.
+        :raises UptimeKumaException: If a referenced entity does not exist.
+        """
+        plan = self.plan(state)
+        if dry_run:
+            print(plan)
+            return plan
+        return self.apply(plan)
+
+    def apply(self, plan: ReconcilePlan) -> ReconcilePlan:
+        """
+        Applies the operations of a plan wave by wave.
+
+        Failed operations do not stop the plan, but the operations that depend on them fail as well.
+
+        :param ReconcilePlan plan: The plan.
+        :return: The plan with the results of the operations.
+        :rtype: ReconcilePlan
+        """
+        for wave in plan.waves:
+            results = _run_concurrently(lambda operation: operation._func(), wave, self.concurrency)
+            for operation, result in zip(wave, results):
+                if isinstance(result, Exception):
+                    operation.error = result
+                else:
+                    operation.result = result
+        return plan
+
+    def plan(self, state: dict) -> ReconcilePlan:
+        """
+        Compares the desired state with the current state.
+
+        :param dict state: The desired state.
+        :return: The plan.
+        :rtype: ReconcilePlan
+        :raises TypeError: If an argument is missing.
+        :raises ValueError: If an argument is invalid.
+        :raises UptimeKumaException: If a referenced entity does not exist.
+        """
+        plan = ReconcilePlan()
+        api = self.api
+        # the monitor and status page data depend on the server capabilities of the info event
+        api._wait_for_capabilities()
+
+        current = {
+            "notification": {i["name"]: i for i in api.get_notifications()},
+            "tag": {i["name"]: i for i in api.get_tags()},
+            "proxy": {_proxy_key(i): i for i in api.get_proxies()},
+            "monitor": {i["name"]: i for i in api.get_monitors()},
+            "maintenance": {i["title"]: i for i in api.get_maintenances()},
+            "status_page": {i["slug"]: i for i in api.get_status_pages()}
+        }
+        desired = {
+            "notification": self._desired(state, "notifications", lambda i: i["name"]),
+            "tag": self._desired(state, "tags", lambda i: i["name"]),
+            "proxy": self._desired(state, "proxies", _proxy_key),
+            "monitor": self._desired(state, "monitors", lambda i: i["name"]),
+            "maintenance": self._desired(state, "maintenances", lambda i: i["title"]),
+            "status_page": self._desired(state, "status_pages", lambda i: i["slug"])
+        }
+        for resource, entities in current.items():
+            for key, entity in entities.items():
+                plan._ids[(resource, key)] = entity["id"]
+
+        def ref(resource, value):
+            # returns the id of an existing entity or a reference to an entity that is added by the plan
+            if value is None or isinstance(value, int):
+                return value
+            if (resource, value) in plan._ids:
+                return plan._ids[(resource, value)]
+            if value in (desired[resource] or {}):
+                return _Ref(resource, value)
+            raise UptimeKumaException(f"{resource} '{value}' does not exist")
+
+        waves = {}
+
+        def add_operation(wave, operation):
+            waves.setdefault(wave, []).append(operation)
+
+        # notifications, tags and proxies do not depend on other entities
+        validators = {
+            "notification": _check_arguments_notification,
+            "tag": _check_arguments_tag,
+            "proxy": _check_arguments_proxy
+        }
+        builders = {
+            "notification": _build_notification_data,
+            "tag": _build_tag_data,
+            "proxy": _build_proxy_data
+        }
+        for resource in ["notification", "tag", "proxy"]:
+            for key, kwargs in (desired[resource] or {}).items():
+                entity = current[resource].get(key)
+                if entity is None:
+                    validators[resource](builders[resource](**kwargs))
+                    add_operation(0, self._add_operation(plan, resource, key, kwargs))
+                else:
+                    changes = _changed_keys(entity, kwargs)
+                    if changes:
+                        validators[resource]({**entity, **kwargs})
+                        add_operation(0, self._edit_operation(plan, resource, key, entity["id"], kwargs, changes))
+
+        # monitors are added after their parents
+        monitors = desired["monitor"] or {}
+        depths = {}
+
+        def depth(name, path=()):
+            if name in path:
+                raise ValueError(f"monitor '{name}' is its own parent")
+            if name not in depths:
+                parent = monitors[name].get("parent")
+                depths[name] = depth(parent, path + (name,)) + 1 if parent in monitors else 0
+            return depths[name]
+
+        monitor_tags = {}
+        for key, kwargs in monitors.items():
+            kwargs = deepcopy(kwargs)
+            tags = kwargs.pop("tags", None)
+            kwargs["parent"] = ref("monitor", kwargs.get("parent"))
+            kwargs["proxyId"] = ref("proxy", kwargs.get("proxyId"))
+            if kwargs.get("notificationIDList"):
+                kwargs["notificationIDList"] = [ref("notification", i) for i in kwargs["notificationIDList"]]
+            kwargs = {k: v for k, v in kwargs.items() if v is not None or k in monitors[key]}
+            if tags is not None:
+                monitor_tags[key] = {
+                    (ref("tag", tag["name"]), tag.get("value", "")): tag["name"] for tag in tags
+                }
+
+            entity = current["monitor"].get(key)
+            if entity is None:
+                data = api._build_monitor_data(**kwargs)
+                _convert_monitor_input(data)
+                _check_arguments_monitor(data)
+                add_operation(1 + depth(key), self._add_operation(plan, "monitor", key, kwargs))
+            else:
+                entity = deepcopy(entity)
+                if isinstance(kwargs.get("notificationIDList"), list):
+                    entity["notificationIDList"] = sorted(entity["notificationIDList"])
+                    kwargs["notificationIDList"] = sorted(kwargs["notificationIDList"], key=str)
+                changes = _changed_keys(entity, kwargs)
+                if changes:
+                    data = {**entity, **kwargs}
+                    _convert_monitor_input(data)
+                    _check_arguments_monitor(data)
+                    add_operation(1 + depth(key), self._edit_operation(plan, "monitor", key, entity["id"], kwargs, changes))
+        monitor_wave = 2 + max(depths.values(), default=0)
+
+        # monitor tags, maintenances and status pages are changed after the monitors
+        for key, tags in monitor_tags.items():
+            entity = current["monitor"].get(key)
+            current_tags = {(i["tag_id"], i["value"]): i["name"] for i in entity["tags"]} if entity else {}
+            monitor_id = ref("monitor", key)
+            for (tag_id, value), name in tags.items():
+                if (tag_id, value) not in current_tags:
+                    add_operation(monitor_wave, ReconcileOperation(
+                        "add", "monitor tag", f"{key}: {name}={value}",
+                        lambda t=tag_id, m=monitor_id, v=value: api.add_monitor_tag(plan._resolve(t), plan._resolve(m), v)
+                    ))
+            for (tag_id, value), name in current_tags.items():
+                if (tag_id, value) not in tags:
+                    add_operation(monitor_wave, ReconcileOperation(
+                        "delete", "monitor tag", f"{key}: {name}={value}",
+                        lambda t=tag_id, m=monitor_id, v=value: api.delete_monitor_tag(t, m, v)
+                    ))
+
+        for key, kwargs in (desired["status_page"] or {}).items():
+            kwargs = deepcopy(kwargs)
+            kwargs.pop("slug")
+            for group in kwargs.get("publicGroupList") or []:
+                group["monitorList"] = [
+                    {**i, "id": ref("monitor", i["id"])} if isinstance(i, dict) else {"id": ref("monitor", i)}
+                    for i in group.get("monitorList", [])
+                ]
+            entity = current["status_page"].get(key)
+            if entity is None:
+                api._build_status_page_data(**{"id": None, "slug": key, **kwargs})
+                add_operation(monitor_wave, self._add_operation(plan, "status_page", key, kwargs))
+            else:
+                entity = api.get_status_page(key)
+                entity.pop("incident")
+                entity.pop("maintenanceList")
+                changes = _changed_keys(entity, kwargs)
+                if changes:
+                    api._build_status_page_data(**{**entity, **kwargs})
+                    add_operation(monitor_wave, self._edit_operation(plan, "status_page", key, key, kwargs, changes))
+
+        for key, kwargs in (desired["maintenance"] or {}).items():
+            kwargs = deepcopy(kwargs)
+            links = {}
+            if "monitors" in kwargs:
+                links["monitor"] = [{"id": ref("monitor", i)} for i in kwargs.pop("monitors")]
+            if "status_pages" in kwargs:
+                links["status_page"] = [{"id": ref("status_page", i)} for i in kwargs.pop("status_pages")]
+            entity = current["maintenance"].get(key)
+            if entity is None:
+                _check_arguments_maintenance(api._build_maintenance_data(**kwargs))
+                add_operation(monitor_wave, self._add_operation(plan, "maintenance", key, kwargs))
+            else:
+                changes = _changed_keys(entity, kwargs)
+                if changes:
+                    _check_arguments_maintenance({**entity, **kwargs})
+                    add_operation(monitor_wave, self._edit_operation(plan, "maintenance", key, entity["id"], kwargs, changes))
+            maintenance_id = ref("maintenance", key)
+            for resource, linked in links.items():
+                if entity is not None and all(isinstance(i["id"], int) for i in linked):
+                    if resource == "monitor":
+                        current_linked = api.get_monitor_maintenance(entity["id"])
+                    else:
+                        current_linked = api.get_status_page_maintenance(entity["id"])
+                    if sorted(i["id"] for i in current_linked) == sorted(i["id"] for i in linked):
+                        continue
+                add_operation(monitor_wave + 1, self._maintenance_link_operation(plan, resource, key, maintenance_id, linked))
+
+        # entities that are not in the desired state are deleted after their dependents
+        if self.prune:
+            delete_wave = monitor_wave + 2
+            for resource in ["maintenance", "status_page"]:
+                for key in self._pruned(current, desired, resource):
+                    add_operation(delete_wave, self._delete_operation(resource, key, current[resource][key]))
+            pruned_monitors = self._pruned(current, desired, "monitor")
+
+            def monitor_depth(name):
+                parent = current["monitor"][name]["parent"]
+                parents = [i for i in pruned_monitors if current["monitor"][i]["id"] == parent]
+                return monitor_depth(parents[0]) + 1 if parents else 0
+
+            max_depth = max((monitor_depth(i) for i in pruned_monitors), default=0)
+            for key in pruned_monitors:
+                # children are deleted before their parents
+                wave = delete_wave + 1 + max_depth - monitor_depth(key)
+                add_operation(wave, self._delete_operation("monitor", key, current["monitor"][key]))
+            for resource in ["notification", "tag", "proxy"]:
+                for key in self._pruned(current, desired, resource):
+                    add_operation(delete_wave + max_depth + 2, self._delete_operation(resource, key, current[resource][key]))
+
+        plan.waves = [waves[i] for i in sorted(waves)]
+        return plan
+
+    @staticmethod
+    def _desired(state, name, key) -> dict | None:
+        if name not in state:
+            return None
+        r = {}
+        for entity in state[name]:
+            k = key(entity)
+            if k in r:
+                raise ValueError(f"duplicate entry '{k}' in {name}")
+            r[k] = entity
+        return r
+
+    @staticmethod
+    def _pruned(current, desired, resource) -> list:
+        if desired[resource] is None:
+            return []
+        return [key for key in current[resource] if key not in desired[resource]]
+
+    def _add_operation(self, plan, resource, key, kwargs) -> ReconcileOperation:
+        api = self.api
+
+        def add():
+            data = plan._resolve(kwargs)
+            if resource == "notification":
+                r = api.add_notification(**data)
+                id_ = r["id"]
+            elif resource == "tag":
+                r = api.add_tag(**data)
+                id_ = r["id"]
+            elif resource == "proxy":
+                r = api.add_proxy(**data)
+                id_ = r["id"]
+            elif resource == "monitor":
+                r = api.add_monitor(**data)
+                id_ = r["monitorID"]
+            elif resource == "maintenance":
+                r = api.add_maintenance(**data)
+                id_ = r["maintenanceID"]
+            else:
+                api.add_status_page(key, data.get("title"))
+                r = api.save_status_page(key, **data)
+                id_ = api.get_status_page(key)["id"]
+            plan._ids[(resource, key)] = id_
+            return r
+
+        return ReconcileOperation("add", resource, key, add)
+
+    def _edit_operation(self, plan, resource, key, id_, kwargs, changes) -> ReconcileOperation:
+        func = {
+            "notification": self.api.edit_notification,
+            "tag": self.api.edit_tag,
+            "proxy": self.api.edit_proxy,
+            "monitor": self.api.edit_monitor,
+            "maintenance": self.api.edit_maintenance,
+            "status_page": self.api.save_status_page
+        }[resource]
+        return ReconcileOperation("edit", resource, key, lambda: func(id_, **plan._resolve(kwargs)), changes)
+
+    def _delete_operation(self, resource, key, entity) -> ReconcileOperation:
+        func = {
+            "notification": self.api.delete_notification,
+            "tag": self.api.delete_tag,
+            "proxy": self.api.delete_proxy,
+            "monitor": self.api.delete_monitor,
+            "maintenance": self.api.delete_maintenance,
+            "status_page": self.api.delete_status_page
+        }[resource]
+        id_ = key if resource == "status_page" else entity["id"]
+        return ReconcileOperation("delete", resource, key, lambda: func(id_))
+
+    def _maintenance_link_operation(self, plan, resource, key, maintenance_id, linked) -> ReconcileOperation:
+        if resource == "monitor":
+            func = self.api.add_monitor_maintenance
+        else:
+            func = self.api.add_status_page_maintenance
+        return ReconcileOperation(
+            "edit", "maintenance", key,
+            lambda: func(plan._resolve(maintenance_id), plan._resolve(linked)),
+            ["monitors" if resource == "monitor" else "status_pages"]
+        )
@@ -0,0 +1,39 @@
+from packaging.version import parse as parse_version
+
+
+class ServerCapabilities(object):
+    """Features of the connected Uptime Kuma server, derived from its version once per connection.
+
+    :param str version: The server version, e.g. ``1.23.2``.
+    """
+
+    def __init__(self, version: str) -> None:
+        self.version = version
+        """The server version as sent by the server."""
+
+        self.parsed_version = parse_version(version)
+        """The parsed server version."""
+
+        self.monitor_parent = self.parsed_version >= parse_version("1.22")
+        """Monitors can be added to monitor groups (``parent``)."""
+
+        self.status_page_auto_theme = self.parsed_version >= parse_version("1.22")
+        """Status pages support the ``auto`` theme."""
+
+        self.monitor_invert_keyword = self.parsed_version >= parse_version("1.23")
+        """Keyword monitors support ``invertKeyword``."""
+
+        self.monitor_timeout = self.parsed_version >= parse_version("1.23")
+        """Monitors support a request ``timeout``."""
+
+        self.gamedig_given_port_only = self.parsed_version >= parse_version("1.23")
+        """GameDig monitors support ``gamedigGivenPortOnly``."""
+
+        self.show_certificate_expiry = self.parsed_version >= parse_version("1.23")
+        """Status pages support ``showCertificateExpiry``."""
+
+        self.chrome_executable = self.parsed_version >= parse_version("1.23")
+        """The settings support ``chromeExecutable``."""
+
+        self.nscd = self.parsed_version >= parse_version("1.23.1")
+        """The settings support ``nscd``."""
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import datetime
+import math
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from .heartbeat_columns import HeartbeatColumns, parse_heartbeat_time
+from .monitor_status import DOWN_STATUSES, UP_STATUSES, MonitorStatus, is_down, is_up
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _normalize(intervals) -> list:
+    # sorts the intervals and merges overlapping and adjacent intervals
+    r = []
+    for start, end in sorted((parse_heartbeat_time(s), parse_heartbeat_time(e)) for s, e in intervals):
+        if start >= end:
+            continue
+        if r and start <= r[-1][1]:
+            r[-1][1] = max(r[-1][1], end)
+        else:
+            r.append([start, end])
+    return r
+
+
+def _intersect(a, b) -> list:
+    r = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if start < end:
+            r.append([start, end])
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return r
+
+
+def _subtract(a, b) -> list:
+    r = []
+    j = 0
+    for start, end in a:
+        while j < len(b) and b[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(b) and b[k][0] < end:
+            if b[k][0] > start:
+                r.append([start, b[k][0]])
+            start = max(start, b[k][1])
+            k += 1
+        if start < end:
+            r.append([start, end])
+    return r
+
+
+def _breakpoints(intervals) -> tuple:
+    # the included time up to x is interpolated linearly between the breakpoints
+    xs = []
+    covered = []
+    total = 0
+    for start, end in intervals:
+        xs += [start, end]
+        covered += [total, total + end - start]
+        total += end - start
+    return xs, covered
+
+
+def _columns(beats) -> tuple:
+    # returns the times, statuses, pings and durations ordered by time
+    if isinstance(beats, HeartbeatColumns):
+        return beats.times(), beats.statuses(), beats.pings(), beats.durations()
+    rows = sorted(
+        (
+            parse_heartbeat_time(beat["time"]),
+            int(beat["status"]),
+            math.nan if beat.get("ping") is None else float(beat["ping"]),
+            int(beat.get("duration") or 0)
+        )
+        for beat in beats
+    )
+    if not rows:
+        return [], [], [], []
+    return tuple(list(column) for column in zip(*rows))
+
+
+def _percentile(values, q) -> float:
+    # linear interpolation between the closest ranks like numpy.percentile, values must be sorted
+    rank = (len(values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _compute_numpy(times, statuses, pings, durations, xs, covered, percentiles) -> dict:
+    times = np.asarray(times, dtype=np.float64)
+    statuses = np.asarray(statuses, dtype=np.int8)
+    pings = np.asarray(pings, dtype=np.float64)
+
+    if xs:
+        # each beat covers the included time since the previous beat
+        first = np.interp(times[:1] - np.asarray(durations[:1], dtype=np.float64), xs, covered)
+        cover = np.diff(np.interp(times, xs, covered), prepend=first)
+        # beats at the end of an included interval are included
+        inside = np.searchsorted(xs, times, side="left") % 2 == 1
+    else:
+        cover = np.zeros_like(times)
+        inside = np.zeros(len(times), dtype=bool)
+
+    down = np.isin(statuses, DOWN_STATUSES)
+    up = np.isin(statuses, UP_STATUSES)
+    incidents = statuses == MonitorStatus.DOWN
+    incidents[1:] &= statuses[:-1] != MonitorStatus.DOWN
+
+    ping_values = pings[inside & up & ~np.isnan(pings)]
+    if len(ping_values) and percentiles:
+        ping_percentiles = np.percentile(ping_values, percentiles).tolist()
+    else:
+        ping_percentiles = [None] * len(percentiles)
+    return {
+        "up_duration": float(cover[up].sum()),
+        "down_duration": float(cover[down].sum()),
+        "incidents": int((incidents & inside).sum()),
+        "beats": int(inside.sum()),
+        "ping_mean": float(ping_values.mean()) if len(ping_values) else None,
+        "ping_percentiles": dict(zip(percentiles, ping_percentiles))
+    }
+
+
+def _compute_python(times, statuses, pings, durations, xs, covered, percentiles) -> dict:
+    def included(x):
+        i = bisect_right(xs, x)
+        if i == 0:
+            return 0
+        if i == len(xs):
+            return covered[-1]
+        return covered[i - 1] + (covered[i] - covered[i - 1]) * (x - xs[i - 1]) / (xs[i] - xs[i - 1])
+
+    up_duration = 0
+    down_duration = 0
+    incidents = 0
+    count = 0
+    ping_values = []
+    previous_time = times[0] - durations[0] if len(times) else None
+    previous_status = None
+    for time_, status, ping in zip(times, statuses, pings):
+        cover = included(time_) - included(previous_time) if xs else 0
+        inside = bisect_left(xs, time_) % 2 == 1
+        if is_down(status):
+            down_duration += cover
+            if inside and status == MonitorStatus.DOWN and previous_status != MonitorStatus.DOWN:
+                incidents += 1
+        elif is_up(status):
+            up_duration += cover
+            if inside and not math.isnan(ping):
+                ping_values.append(ping)
+        if inside:
+            count += 1
+        previous_time = time_
+        previous_status = status
+
+    ping_values.sort()
+    return {
+        "up_duration": float(up_duration),
+        "down_duration": float(down_duration),
+        "incidents": incidents,
+        "beats": count,
+        "ping_mean": math.fsum(ping_values) / len(ping_values) if ping_values else None,
+        "ping_percentiles": {
+            q: _percentile(ping_values, q) if ping_values else None for q in percentiles
+        }
+    }
+
+
+def business_hours(
+        start: datetime.datetime | str | float,
+        end: datetime.datetime | str | float,
+        days: Iterable[int] = (0, 1, 2, 3, 4),
+        hours: tuple = (9, 17),
+        tz: datetime.tzinfo = datetime.timezone.utc
+) -> list[tuple[float, float]]:
+    """
+    Returns the business hours between two times as intervals of unix timestamps.
+
+    The result can be passed as ``include`` to :func:`compute_sla`.
+
+    :param start: The start as datetime, heartbeat time string or unix timestamp.
+    :param end: The end as datetime, heartbeat time string or unix timestamp.
+    :param list, optional days: The weekdays, Monday is ``0``, defaults to Monday to Friday
+    :param tuple, optional hours: The start and end hour of each day, e.g. ``(8.5, 17)``, defaults to ``(9, 17)``
+    :param datetime.tzinfo, optional tz: The timezone of the hours, defaults to UTC
+    :return: The business hours.
+    :rtype: list
+
+    Example::
+
+        >>> from zoneinfo import ZoneInfo
+        >>> business_hours("2023-01-02", "2023-01-04", hours=(9, 17), tz=ZoneInfo("Europe/Berlin"))
+        [
+            (1672646400.0, 1672675200.0),
+            (1672732800.0, 1672761600.0)
+        ]
+    """
+    start = parse_heartbeat_time(start)
+    end = parse_heartbeat_time(end)
+    days = set(days)
+    r = []
+    day = datetime.datetime.fromtimestamp(start, tz).date()
+    last_day = datetime.datetime.fromtimestamp(end, tz).date()
+    while day <= last_day:
+        if day.weekday() in days:
+            midnight = datetime.datetime.combine(day, datetime.time(), tzinfo=tz)
+            interval_start = max((midnight + datetime.timedelta(hours=hours[0])).timestamp(), start)
+            interval_end = min((midnight + datetime.timedelta(hours=hours[1])).timestamp(), end)
+            if interval_start < interval_end:
+                r.append((interval_start, interval_end))
+        day += datetime.timedelta(days=1)
+    return r
+
+
+def compute_sla(
+        beats: Iterable[dict] | HeartbeatColumns,
+        start: datetime.datetime | str | float = None,
+        end: datetime.datetime | str | float = None,
+        include: Iterable[tuple] = None,
+        exclude: Iterable[tuple] = None,
+        percentiles: Iterable[float] = (50, 95, 99)
+) -> dict:
+    """
+    Computes the uptime, the downtime, the ping statistics and the incidents of a monitor.
+
+    Each beat covers the time since the previous beat, the first beat covers its ``duration``.
+    The beats count as uptime or downtime as described in :func:`~.monitor_status.is_up`.
+    An incident starts with each :attr:`~.MonitorStatus.DOWN` beat that follows a beat that is not
+    :attr:`~.MonitorStatus.DOWN`.
+    The ping statistics include the pings of the up beats.
+
+    Only the time within the window that is in ``include`` and not in ``exclude`` is counted,
+    e.g. :func:`business_hours` or the time slots of maintenances.
+
+    The computation uses NumPy if it is installed.
+
+    :param beats: The beats of the monitor, e.g. of :meth:`~.UptimeKumaApi.get_monitor_beats`,
+        :meth:`~.UptimeKumaApi.get_heartbeats` or :meth:`~.UptimeKumaApi.get_heartbeat_columns`.
+    :param start: The start of the window as datetime, heartbeat time string or unix timestamp,
+        defaults to None (the start of the first beat)
+    :param end: The end of the window as datetime, heartbeat time string or unix timestamp,
+        defaults to None (the last beat)
+    :param list, optional include: The intervals ``(start, end)`` that are counted, defaults to None (the window)
+    :param list, optional exclude: The intervals ``(start, end)`` that are not counted, defaults to None
+    :param list, optional percentiles: The ping percentiles, defaults to ``(50, 95, 99)``
+    :return: The uptime ratio, the up and down duration in seconds, the number of incidents and beats,
+        and the mean and percentiles of the pings. The uptime is None if no time is counted.
+    :rtype: dict
+
+    Example::
+
+        >>> beats = api.get_monitor_beats(1, 24 * 30)
+        >>> compute_sla(beats, exclude=[("2023-01-10 22:00:00", "2023-01-10 23:00:00")])
+        {
+            'beats': 43184,
+            'down_duration': 240.0,
+            'incidents': 2,
+            'ping_mean': 201.4,
+            'ping_percentiles': {
+                50: 193.0,
+                95: 312.0,
+                99: 540.0
+            },
+            'up_duration': 2587320.0,
+            'uptime': 0.9999072
+        }
+    """
+    times, statuses, pings, durations = _columns(beats)
+    if start is None:
+        start = times[0] - durations[0] if len(times) else 0
+    if end is None:
+        end = times[-1] if len(times) else 0
+    intervals = _normalize([(start, end)])
+    if include is not None:
+        intervals = _intersect(intervals, _normalize(include))
+    if exclude is not None:
+        intervals = _subtract(intervals, _normalize(exclude))
+    xs, covered = _breakpoints(intervals)
+
+    compute = _compute_numpy if np is not None else _compute_python
+    r = compute(times, statuses, pings, durations, xs, covered, tuple(percentiles))
+    total = r["up_duration"] + r["down_duration"]
+    r["uptime"] = r["up_duration"] / total if total else None
+    return r
+
+
+def compute_slas(heartbeats: dict, **kwargs) -> dict[int, dict]:
+    """
+    Computes the SLA of multiple monitors, see :func:`compute_sla`.
+
+    :param dict heartbeats: The beats by monitor id, e.g. of :meth:`~.UptimeKumaApi.get_heartbeats`
+        or :meth:`~.UptimeKumaApi.get_heartbeat_columns`.
+    :param kwargs: The arguments of :func:`compute_sla`.
+    :return: The SLA by monitor id.
+    :rtype: dict
+
+    Example::
+
+        >>> compute_slas(api.get_heartbeat_columns(), include=business_hours(start, end))
+        {
+            1: {
+                'beats': 150,
+                ...
+            }
+        }
+    """
+    return {monitor_id: compute_sla(beats, **kwargs) for monitor_id, beats in heartbeats.items()}
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Iterator
+
+from . import OverflowPolicy, Timeout, UptimeKumaException
+
+
+class Subscription(object):
+    """A bounded queue of event messages that can be consumed as a blocking iterator.
+
+    Subscriptions are created by :meth:`~.UptimeKumaApi.subscribe` and filled directly by the event handlers.
+    Iterating over a subscription blocks until the next message arrives and stops when the subscription is closed.
+
+    :param int maxsize: How many messages are queued.
+    :param OverflowPolicy overflow: What happens when the queue is full.
+    """
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy) -> None:
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        """Number of messages that were dropped because the queue was full."""
+        self.closed = False
+        self._messages = deque()
+        self._condition = threading.Condition()
+        self._unsubscribe = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        with self._condition:
+            self._condition.wait_for(lambda: self._messages or self.closed)
+            if not self._messages:
+                raise StopIteration
+            return self._pop()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _pop(self) -> Any:
+        message = self._messages.popleft()
+        self._condition.notify_all()
+        return message
+
+    def _put(self, message) -> None:
+        # called by the event handlers
+        with self._condition:
+            while len(self._messages) >= self.maxsize and not self.closed:
+                if self.overflow == OverflowPolicy.DROP:
+                    self.dropped += 1
+                    return
+                self._condition.wait()
+            if self.closed:
+                return
+            self._messages.append(message)
+            self._condition.notify_all()
+
+    def get(self, timeout: float = None) -> Any:
+        """
+        Get the next message.
+
+        :param float, optional timeout: How many seconds to wait. Defaults to None (wait forever).
+        :return: The message.
+        :raises Timeout: If no message arrives in time.
+        :raises UptimeKumaException: If the subscription is closed and all messages have been consumed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._messages or self.closed, timeout=timeout):
+                raise Timeout("Timed out while waiting for the next message")
+            if not self._messages:
+                raise UptimeKumaException("subscription is closed")
+            return self._pop()
+
+    def close(self) -> None:
+        """
+        Stop receiving messages. Messages that are already queued can still be consumed.
+        """
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()